@@ -0,0 +1,212 @@
+# Offline end-to-end benchmark: runs run_daily_job_posting against a local MyJobMag
+# stand-in (synthetic listing and detail pages) and a fake Blogger API that serves
+# batch posts.insert calls with configurable latency and injected 429s.
+#
+# Run from the repo root:
+#   python benchmarks/bench_e2e.py                      # 40, 400 and 4000 jobs
+#   python benchmarks/bench_e2e.py --sizes 40 --latency-ms 200 --error-rate 0.1
+#
+# Each size runs in a fresh subprocess (clean caches, index and peak RSS) and
+# reports throughput, latency percentiles from the run report, and peak memory.
+# The stand-in servers share the child process, so peak RSS includes them.
+import argparse
+import email.parser
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, HERE)
+
+import synthetic
+
+def make_handler(total_jobs, per_page, latency, error_rate):
+    counts = {'listing': 0, 'detail': 0, 'batches': 0, 'inserts': 0, 'throttled': 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True  # Otherwise delayed ACKs add ~40 ms per response
+
+        def log_message(self, *args):
+            pass
+
+        def send(self, status, body, content_type='text/html; charset=utf-8'):
+            body = body.encode('utf-8') if isinstance(body, str) else body
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path == '/jobs':
+                page = int(parse_qs(parts.query).get('page', ['1'])[0])
+                if (page - 1) * per_page >= total_jobs:
+                    return self.send(404, 'Not found')
+                with lock:
+                    counts['listing'] += 1
+                return self.send(200, synthetic.listing_page(page, per_page, total_jobs))
+            if parts.path.startswith('/job/'):
+                with lock:
+                    counts['detail'] += 1
+                return self.send(200, synthetic.detail_page(parts.path[len('/job/'):]))
+            self.send(404, 'Not found')
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.path.startswith('/batch'):
+                return self.batch(body)
+            self.send(404, 'Not found')
+
+        def insert_response(self):
+            with lock:
+                if random.random() < error_rate:
+                    counts['throttled'] += 1
+                    return 429, {'error': {'code': 429, 'message': 'Rate Limit Exceeded'}}
+                counts['inserts'] += 1
+                post_id = counts['inserts']
+            return 200, {'kind': 'blogger#post', 'id': str(post_id),
+                         'url': f'http://blog.example/{post_id}.html', 'title': 'posted'}
+
+        def batch(self, body):
+            time.sleep(latency)
+            with lock:
+                counts['batches'] += 1
+            message = email.parser.BytesParser().parsebytes(
+                b'Content-Type: ' + self.headers['Content-Type'].encode() + b'\r\n\r\n' + body)
+            boundary = 'batch_response_boundary'
+            out = []
+            for part in message.get_payload():
+                request = part.get_payload()
+                request_body = json.loads(request.split('\r\n\r\n', 1)[1] or '{}') if '\r\n\r\n' in request else {}
+                status, payload = self.insert_response()
+                if status == 200:
+                    payload['title'] = request_body.get('title', 'posted')
+                content_id = part['Content-ID'].strip('<>')
+                text = json.dumps(payload)
+                reason = 'OK' if status == 200 else 'Too Many Requests'
+                out.append(
+                    f'--{boundary}\r\nContent-Type: application/http\r\n'
+                    f'Content-ID: <response-{content_id}>\r\n\r\n'
+                    f'HTTP/1.1 {status} {reason}\r\nContent-Type: application/json; charset=UTF-8\r\n'
+                    f'Content-Length: {len(text)}\r\n\r\n{text}\r\n'
+                )
+            out.append(f'--{boundary}--\r\n')
+            self.send(200, ''.join(out), f'multipart/mixed; boundary={boundary}')
+
+    return Handler, counts
+
+def blogger_service(base_url):
+    # Blogger client built from the bundled discovery document, re-rooted at the fake API
+    import httplib2
+    import googleapiclient.discovery_cache
+    from googleapiclient.discovery import build_from_document
+    path = os.path.join(os.path.dirname(googleapiclient.discovery_cache.__file__), 'documents', 'blogger.v3.json')
+    with open(path) as f:
+        doc = json.load(f)
+    doc['rootUrl'] = base_url + '/'
+    doc['baseUrl'] = base_url + '/' + doc['servicePath']
+    return build_from_document(doc, http=httplib2.Http())
+
+def run_one(args):
+    # Child process: everything is configured through the environment before import
+    workdir = tempfile.mkdtemp(prefix='bench_e2e_')
+    os.environ.update({
+        'JOB_INDEX_PATH': os.path.join(workdir, 'index.sqlite'),
+        'HTTP_CACHE_PATH': os.path.join(workdir, 'http_cache.sqlite'),
+        'RUN_REPORT_PATH': os.path.join(workdir, 'run_report.json'),
+        'HOST_MIN_INTERVAL': '0',
+        'BLOGGER_REQUESTS_PER_MINUTE': str(args.quota_per_minute),
+        'MAX_LISTING_PAGES': str(args.jobs // args.per_page + 2),
+        'ENRICH_DETAILS': '0' if args.no_details else '1',
+    })
+    handler, counts = make_handler(args.jobs, args.per_page, args.latency_ms / 1000, args.error_rate)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    sys.path.insert(0, ROOT)
+    import job_automation
+    job_automation.MYJOBMAG_BASE = base_url
+    job_automation.backoff_delay = lambda attempt, base=0.05, cap=1.0: random.uniform(0, min(cap, base * 2 ** attempt))
+    service = blogger_service(base_url)
+
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            report = job_automation.run_daily_job_posting(args.jobs, service=service)
+        finally:
+            sys.stdout = stdout
+    wall = time.perf_counter() - started
+    server.shutdown()
+
+    timings = report['timings']
+    pick = lambda name: {k: timings[name][k] for k in ('p50', 'p95', 'max')} if name in timings else None
+    print(json.dumps({
+        'jobs': args.jobs,
+        'posted': report['jobs']['posted'],
+        'failed': report['jobs']['failed'],
+        'wall_seconds': wall,
+        'jobs_per_second': report['jobs']['posted'] / wall if wall else 0,
+        'http_latency': pick('http.latency'),
+        'render_job': pick('render.job'),
+        'publish_batch': pick('publish.batch'),
+        'retries': report['counters'].get('blogger.retries', 0),
+        'server': counts,
+        'peak_rss_mib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+def ms(summary, key):
+    return f"{summary[key] * 1000:8.2f}" if summary else '       -'
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[40, 400, 4000])
+    parser.add_argument('--per-page', type=int, default=20, help='Jobs per synthetic listing page')
+    parser.add_argument('--latency-ms', type=float, default=50, help='Fake Blogger latency per HTTP call')
+    parser.add_argument('--error-rate', type=float, default=0.02, help='Share of inserts answered with 429')
+    parser.add_argument('--quota-per-minute', type=int, default=1_000_000, help='BLOGGER_REQUESTS_PER_MINUTE for the run')
+    parser.add_argument('--no-details', action='store_true', help='Skip detail-page enrichment')
+    parser.add_argument('--json', action='store_true', help='Print raw JSON results')
+    parser.add_argument('--jobs', type=int, help=argparse.SUPPRESS)  # Internal: run one size in this process
+    args = parser.parse_args()
+
+    if args.jobs:
+        return run_one(args)
+
+    results = []
+    for size in args.sizes:
+        cmd = [sys.executable, os.path.abspath(__file__), '--jobs', str(size),
+               '--per-page', str(args.per_page), '--latency-ms', str(args.latency_ms),
+               '--error-rate', str(args.error_rate), '--quota-per-minute', str(args.quota_per_minute)]
+        if args.no_details:
+            cmd.append('--no-details')
+        output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'jobs':>6} {'posted':>6} {'wall s':>8} {'jobs/s':>8} {'http p50':>8} {'http p95':>8} "
+          f"{'rend p95':>8} {'batch p50':>9} {'batch p95':>9} {'retries':>7} {'rss MiB':>8}")
+    for r in results:
+        print(f"{r['jobs']:>6} {r['posted']:>6} {r['wall_seconds']:>8.2f} {r['jobs_per_second']:>8.1f} "
+              f"{ms(r['http_latency'], 'p50')} {ms(r['http_latency'], 'p95')} {ms(r['render_job'], 'p95')} "
+              f" {ms(r['publish_batch'], 'p50')} {ms(r['publish_batch'], 'p95')} {r['retries']:>7} {r['peak_rss_mib']:>8.1f}")
+    print('(latencies in ms)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Listing-page parse benchmark: XPath fast path vs the BeautifulSoup class-guessing fallback.
+# Run from the repo root: python benchmarks/bench_parse.py [pages...] [--repeat 20]
+# Defaults to the saved pages in benchmarks/fixtures/. Peak memory is what tracemalloc sees,
+# i.e. Python objects (the soup tree); libxml2's own C buffers are not included.
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from job_automation import parse_listing_fast, parse_listing_heuristic
+
+PARSERS = [('fast (lxml XPath)', parse_listing_fast), ('heuristic (bs4)', parse_listing_heuristic)]
+
+def measure(parse, pages, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for markup in pages:
+            parse(markup, 'https://www.myjobmag.co.ke/jobs')
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    jobs = sum(len(parse(markup, 'https://www.myjobmag.co.ke/jobs')) for markup in pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best / len(pages), peak, jobs
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('pages', nargs='*', default=sorted(glob.glob(os.path.join(HERE, 'fixtures', '*.html'))))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    pages = []
+    for path in args.pages:
+        with open(path, encoding='utf-8') as f:
+            pages.append(f.read())
+    print(f"{len(pages)} pages, {sum(map(len, pages)) / 1024:.0f} KiB total")
+    for name, parse in PARSERS:
+        per_page, peak, jobs = measure(parse, pages, args.repeat)
+        print(f"{name:<20} {per_page * 1000:8.2f} ms/page  peak {peak / 1024:8.0f} KiB  {jobs} jobs")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# Micro-benchmark: jobs/second rendered by the old per-job f-string vs the compiled template.
+# Run from the repo root: python benchmarks/bench_render.py [--jobs 2000] [--repeat 5]
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from job_automation import format_job_post
+from legacy_render import legacy_format_job_post
+
+TITLES = ['Finance Manager', 'Compliance Officer', 'Enterprise Architect', 'Senior Software Engineer', 'Accountant']
+COMPANIES = ['GIZ Kenya', 'Acme Holdings', 'Umoja NGO', 'Safari Tech Ltd']
+
+def sample_jobs(count):
+    published = str(datetime.now())
+    return [{
+        'title': f'{TITLES[i % len(TITLES)]} {i}',
+        'url': f'https://www.myjobmag.co.ke/job/sample-{i}',
+        'description': 'Lead "key" operations for a growing Kenyan firm. ' * 8,
+        'company': COMPANIES[i % len(COMPANIES)],
+        'location': 'Nairobi, Kenya',
+        'published': published
+    } for i in range(count)]
+
+def best_rate(render, jobs, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for job in jobs:
+            render(job)
+        best = min(best, time.perf_counter() - start)
+    return len(jobs) / best
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    jobs = sample_jobs(args.jobs)
+    before = best_rate(legacy_format_job_post, jobs, args.repeat)
+    after = best_rate(format_job_post, jobs, args.repeat)
+    print(f"before (f-string):  {before:10.0f} jobs/s")
+    print(f"after  (compiled):  {after:10.0f} jobs/s")
+    print(f"speed-up:           {after / before:10.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# Synthetic MyJobMag pages shaped like the live site, for benchmarks and offline runs.
+import html
+
+ROLES = ['Finance Manager', 'Compliance Officer', 'Enterprise Architect', 'Senior Accountant',
+         'Software Engineer', 'Procurement Officer', 'Project Coordinator', 'Sales Executive']
+EMPLOYERS = ['Acme Holdings Ltd', 'Umoja NGO', 'GIZ Kenya', 'Safari Tech Ltd', 'Kilimo Bank', 'Pwani Logistics']
+
+CHROME_TOP = '''<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Jobs in Kenya - MyJobMag</title>
+<link rel="stylesheet" href="/css/main.css"><script src="/js/app.js"></script></head>
+<body><div class="header-wrap"><div class="nav-item"><a href="/">Home</a></div><div class="nav-item"><a href="/jobs">Jobs</a></div>
+<div class="nav-item"><a href="/jobs-by-field">Jobs by Field</a></div><div class="nav-item"><a href="/jobs-by-location">Jobs by Location</a></div></div>
+<div class="main-wrap"><div class="job-list-wrap"><h1 class="page-title">Latest Jobs in Kenya</h1>
+<ul class="job-list">
+'''
+
+SIDEBAR = ''.join(
+    f'<div class="sidebar-item"><div class="item-inner"><span class="item-label">Jobs in {town}</span></div></div>'
+    for town in ['Nairobi', 'Mombasa', 'Kisumu', 'Nakuru', 'Eldoret', 'Thika', 'Machakos', 'Nyeri'] * 4
+)
+
+CHROME_BOTTOM = '''</ul><div class="pagination"><a href="/jobs?page=2">Next</a></div></div>
+<div class="sidebar">''' + SIDEBAR + '''</div></div>
+<div class="footer-wrap"><div class="footer-item">&copy; MyJobMag Kenya</div></div></body></html>
+'''
+
+def job_slug(index):
+    role = ROLES[index % len(ROLES)]
+    employer = EMPLOYERS[index % len(EMPLOYERS)]
+    return f"{role}-{employer}-{index}".lower().replace(' ', '-')
+
+def job_card(index):
+    role = ROLES[index % len(ROLES)]
+    employer = EMPLOYERS[index % len(EMPLOYERS)]
+    title = html.escape(f'{role} {index} at {employer}')
+    desc = html.escape(f'{employer} is looking for a {role} to join its team. ' * 6)
+    return f'''<li class="job-list-li">
+  <div class="job-logo"><a href="/jobs-at/{employer.lower().replace(' ', '-')}"><img src="/logo/{index}.png" alt="{html.escape(employer)}"></a></div>
+  <div class="job-info"><ul>
+    <li class="mag-b"><h2><a class="job-title" href="/job/{job_slug(index)}">{title}</a></h2></li>
+    <li class="job-desc">{desc}</li>
+    <li class="job-item"><ul><li id="job-date">18 October</li><li class="job-field">Finance / Accounting / Audit</li></ul></li>
+  </ul></div>
+</li>
+'''
+
+def listing_page(page, per_page=20, total=None):
+    # Page numbers start at 1; pages past `total` jobs are empty listings
+    start = (page - 1) * per_page
+    stop = start + per_page if total is None else min(start + per_page, total)
+    return CHROME_TOP + ''.join(job_card(i) for i in range(start, stop)) + CHROME_BOTTOM
+
+def detail_page(slug):
+    # Detail page for a slug produced by job_slug(); the trailing number is the job index
+    index = int(slug.rsplit('-', 1)[-1]) if slug.rsplit('-', 1)[-1].isdigit() else 0
+    role = ROLES[index % len(ROLES)]
+    employer = EMPLOYERS[index % len(EMPLOYERS)]
+    paragraphs = ''.join(
+        f'<p>{html.escape(employer)} seeks a {role} to own area {n} of its operations, '
+        f'working with teams across Kenya to deliver measurable results.</p>'
+        for n in range(12)
+    )
+    return CHROME_TOP.replace('<ul class="job-list">', '') + f'''
+<h1>{html.escape(role)} {index} at {html.escape(employer)}</h1>
+<a href="/jobs-at/{employer.lower().replace(' ', '-')}">{html.escape(employer)}</a>
+<ul class="job-key-info">
+  <li><span class="jkey-title">Job Type</span><span class="jkey-info">Full Time</span></li>
+  <li><span class="jkey-title">Location</span><span class="jkey-info">{['Nairobi', 'Mombasa', 'Kisumu'][index % 3]}</span></li>
+  <li><span class="jkey-title">Salary</span><span class="jkey-info">KSh {60 + index % 5 * 10},000 - {90 + index % 5 * 10},000</span></li>
+</ul>
+<div class="job-details">{paragraphs}</div>
+<div class="read-date-sec-li">Deadline: Dec {1 + index % 28}, 2026</div>
+''' + CHROME_BOTTOM.replace('</ul>', '', 1)
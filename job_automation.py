@@ -1,26 +1,183 @@
-from googleapiclient.discovery import build
+import time
+_IMPORT_STARTED = time.perf_counter()
 import pickle
 import os
-from google.auth.transport.requests import Request
-import requests
-from bs4 import BeautifulSoup
+import sys
+import argparse
 import json
+import html
+import string
 from datetime import datetime, timedelta
 import re
-import time
 import base64  # For GitHub Actions token decoding
-from google.colab import drive  # For Colab Drive mount (optional)
+import threading
+import hashlib
+import functools
+import random
+import socket
+import queue
+import contextlib
+import cProfile
+import pstats
+import sqlite3
+from urllib.parse import urlsplit, urlunsplit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+# requests, lxml, bs4 and the Google client libraries are imported where they are
+# used, so dry runs and render-only runs don't pay for them
 
 # Mount Drive for persistence (Colab-specific)
 try:
+    from google.colab import drive  # Only importable inside Colab
     drive.mount('/content/drive')
-except:
+except Exception:
     pass  # Ignore if not in Colab (e.g., GitHub Actions)
 
 # Your Blog ID
 BLOG_ID = '71655510733035331'
 
+# Scraper settings
+MYJOBMAG_BASE = 'https://www.myjobmag.co.ke'
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'}
+REQUEST_TIMEOUT = (5, 20)  # (connect, read) seconds
+FETCH_CONCURRENCY = int(os.environ.get('FETCH_CONCURRENCY', 4))  # Listing pages in flight at once
+MAX_LISTING_PAGES = int(os.environ.get('MAX_LISTING_PAGES', 50))
+MAX_PAGE_FAILURES = 3  # Consecutive failed listing pages before the crawl stops
+SOURCE_TIMEOUT = float(os.environ.get('SOURCE_TIMEOUT', 300))  # Seconds one job board may take
+SOURCES_DEADLINE = float(os.environ.get('SOURCES_DEADLINE', 600))  # Seconds for all job boards together
+ENRICH_DETAILS = os.environ.get('ENRICH_DETAILS', '1') == '1'  # Fetch each job's detail page
+DETAIL_CONCURRENCY = int(os.environ.get('DETAIL_CONCURRENCY', 6))  # Detail pages in flight at once
+HOST_MIN_INTERVAL = float(os.environ.get('HOST_MIN_INTERVAL', 0.5))  # Seconds between requests to one host
+DETAIL_DESCRIPTION_CHARS = 2000
+
+_session = None
+_session_lock = threading.Lock()
+_response_cache = None
+
+# Blogger publishing settings
+BLOGGER_REQUESTS_PER_MINUTE = int(os.environ.get('BLOGGER_REQUESTS_PER_MINUTE', 60))
+PUBLISH_BATCH_SIZE = 10
+MAX_PUBLISH_ATTEMPTS = 5
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+PIPELINE_QUEUE_SIZE = 20  # Jobs buffered between pipeline stages
+PUBLISH_LINGER = 0.5  # Seconds to wait for a publish batch to fill
+SYNC_POSTS = os.environ.get('SYNC_POSTS', '0') == '1'  # Patch changed posts and expire old ones
+EXPIRE_ACTION = os.environ.get('EXPIRE_ACTION', 'revert')  # Expired posts: 'revert' to draft or 'delete'
+
+# Conditional-GET response cache for listing and detail pages ('' disables it)
+HTTP_CACHE_PATH = os.environ.get('HTTP_CACHE_PATH', '/content/drive/MyDrive/http_cache.sqlite' if os.path.exists('/content/drive') else 'http_cache.sqlite')
+HTTP_CACHE_MAX_BYTES = int(os.environ.get('HTTP_CACHE_MAX_BYTES', 20 * 1024 * 1024))
+DETAIL_CACHE_TTL = 24 * 3600  # Seconds a detail page is trusted without revalidating
+
+# Index of jobs already posted to the blog (kept on Drive under Colab)
+JOB_INDEX_PATH = os.environ.get('JOB_INDEX_PATH', '/content/drive/MyDrive/published_jobs.sqlite' if os.path.exists('/content/drive') else 'published_jobs.sqlite')
+
+# Local copy of the Blogger API discovery document; without one the copy bundled
+# with google-api-python-client is used. Either way no discovery request is made.
+BLOGGER_DISCOVERY_PATH = os.environ.get('BLOGGER_DISCOVERY_PATH', 'blogger_v3_discovery.json')
+
+STARTUP_TIMES = {}  # Seconds spent importing this module and authenticating
+
+# Machine-readable timings and counters for each run
+RUN_REPORT_PATH = os.environ.get('RUN_REPORT_PATH', 'run_report.json')
+
+class RunMetrics:
+    # Thread-safe counters and timers; report() summarises them for the JSON run report
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.counters = {}
+            self.timings = {}
+
+    def incr(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, seconds):
+        with self.lock:
+            self.timings.setdefault(name, []).append(seconds)
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def timed(self, name, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self.timer(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    def report(self):
+        with self.lock:
+            timings = {}
+            for name, values in self.timings.items():
+                ordered = sorted(values)
+                timings[name] = {
+                    'count': len(ordered),
+                    'total': sum(ordered),
+                    'mean': sum(ordered) / len(ordered),
+                    'p50': ordered[len(ordered) // 2],
+                    'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                    'max': ordered[-1],
+                }
+            return {
+                'started_at': datetime.fromtimestamp(self.started).isoformat(),
+                'duration_seconds': time.time() - self.started,
+                'startup_seconds': dict(STARTUP_TIMES),
+                'counters': dict(sorted(self.counters.items())),
+                'timings': dict(sorted(timings.items())),
+            }
+
+    def write(self, path=RUN_REPORT_PATH, **extra):
+        report = {**self.report(), **extra}
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+metrics = RunMetrics()
+
+def profile_threads():
+    # Before 3.12, cProfile only sees the thread that enabled it: give every new thread
+    # its own profiler and hand back the list so they can be merged afterwards. From
+    # 3.12 it runs on sys.monitoring, which already covers every thread and allows a
+    # single active profiler, so nothing is added there.
+    profiles = []
+    if sys.version_info >= (3, 12):
+        return profiles
+
+    def start(frame, event, arg):
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        except Exception as e:
+            # Profiling must never take down a pipeline thread
+            sys.setprofile(None)
+            print(f"Could not profile thread {threading.current_thread().name}: {e}")
+            return
+        profiles.append(profiler)
+
+    threading.setprofile(start)
+    return profiles
+
+def build_blogger_service(credentials=None, http=None):
+    from googleapiclient.discovery import build, build_from_document
+    kwargs = {'credentials': credentials} if http is None else {'http': http}
+    if os.path.exists(BLOGGER_DISCOVERY_PATH):
+        with open(BLOGGER_DISCOVERY_PATH) as f:
+            return build_from_document(f.read(), **kwargs)
+    return build('blogger', 'v3', static_discovery=True, cache_discovery=False, **kwargs)
+
 def authenticate():
+    from google.auth.transport.requests import Request
     creds = None
     if os.path.exists('token.pickle'):
         with open('token.pickle', 'rb') as token:
@@ -35,179 +192,718 @@ def authenticate():
     if os.path.exists('/content/drive'):
         with open('/content/drive/MyDrive/token.pickle', 'wb') as token:
             pickle.dump(creds, token)
-    return build('blogger', 'v3', credentials=creds)
+    return build_blogger_service(creds)
+
+def get_session():
+    # One keep-alive session shared by every worker thread
+    global _session
+    import requests
+    from requests.adapters import HTTPAdapter
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            pool_size = FETCH_CONCURRENCY + DETAIL_CONCURRENCY
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
+class HostScheduler:
+    # Politeness: spaces requests to the same host at least `interval` seconds apart,
+    # however many worker threads are fetching
+    def __init__(self, interval=HOST_MIN_INTERVAL):
+        self.interval = interval
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+host_scheduler = HostScheduler()
+
+def polite_get(session, url, headers=None):
+    host_scheduler.wait(url)
+    started = time.perf_counter()
+    response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    metrics.observe('http.latency', time.perf_counter() - started)
+    metrics.incr('http.requests')
+    metrics.incr(f'http.status.{response.status_code}')
+    metrics.incr('http.bytes_downloaded', len(response.content))
+    return response
+
+class ResponseCache:
+    # Keeps validators, a body hash and the *parsed* result per URL, so a 304 or an
+    # unchanged body skips parsing entirely. Each row records the version of the
+    # parser that produced it. Bounded by size with LRU eviction.
+    def __init__(self, path=HTTP_CACHE_PATH, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                ' url TEXT PRIMARY KEY,'
+                ' etag TEXT,'
+                ' last_modified TEXT,'
+                ' body_hash TEXT NOT NULL,'
+                ' parsed TEXT NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' fetched_at REAL NOT NULL,'
+                ' accessed_at REAL NOT NULL,'
+                ' parser_version INTEGER NOT NULL DEFAULT 0)'
+            )
+            columns = {row[1] for row in self.conn.execute('PRAGMA table_info(responses)')}
+            if 'parser_version' not in columns:
+                # Caches from before versioning; their rows read as version 0, i.e. stale
+                self.conn.execute('ALTER TABLE responses ADD COLUMN parser_version INTEGER NOT NULL DEFAULT 0')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+    def lookup(self, url):
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT etag, last_modified, body_hash, parsed, fetched_at, parser_version FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('etag', 'last_modified', 'body_hash', 'parsed', 'fetched_at', 'parser_version'), row))
 
-def fetch_myjobmag_jobs(limit=40):
+    def touch(self, url, revalidated=False, etag=None, last_modified=None):
+        now = time.time()
+        with self.lock, self.conn:
+            if revalidated:
+                self.conn.execute(
+                    'UPDATE responses SET fetched_at = ?, accessed_at = ?,'
+                    ' etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?',
+                    (now, now, etag, last_modified, url)
+                )
+            else:
+                self.conn.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (now, url))
+
+    def store(self, url, etag, last_modified, body_hash, parsed, parser_version):
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses'
+                ' (url, etag, last_modified, body_hash, parsed, size, fetched_at, accessed_at, parser_version)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, etag, last_modified, body_hash, parsed, len(parsed), now, now, parser_version)
+            )
+            total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if total > self.max_bytes:
+                # Drop least recently used entries until back under the limit
+                rows = self.conn.execute('SELECT url, size FROM responses ORDER BY accessed_at').fetchall()
+                stale = []
+                for old_url, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    stale.append((old_url,))
+                    total -= size
+                self.conn.executemany('DELETE FROM responses WHERE url = ?', stale)
+
+    def close(self):
+        self.conn.close()
+
+def get_response_cache():
+    global _response_cache
+    with _session_lock:
+        if _response_cache is None and HTTP_CACHE_PATH:
+            _response_cache = ResponseCache()
+    return _response_cache
+
+def cached_get(session, url, parse, ttl=None, version=0):
+    # Returns (status_code, parse(body)). parse's result must be JSON-serialisable.
+    # Bump `version` whenever parse's output changes; older cached results are then
+    # treated as misses.
+    cache = get_response_cache()
+    entry = cache.lookup(url) if cache else None
+    if entry and entry['parser_version'] != version:
+        metrics.incr('http_cache.stale_parser')
+        entry = None
+    if entry and ttl is not None and time.time() - entry['fetched_at'] < ttl:
+        cache.touch(url)
+        metrics.incr('http_cache.fresh')
+        return 200, json.loads(entry['parsed'])
+    headers = {}
+    if entry and entry['etag']:
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry['last_modified']:
+        headers['If-Modified-Since'] = entry['last_modified']
+    response = polite_get(session, url, headers=headers)
+    if response.status_code == 304 and entry:
+        cache.touch(url, revalidated=True)
+        metrics.incr('http_cache.not_modified')
+        return 200, json.loads(entry['parsed'])
+    if response.status_code != 200:
+        return response.status_code, None
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    body_hash = hashlib.sha256(response.content).hexdigest()
+    if entry and entry['body_hash'] == body_hash:
+        cache.touch(url, revalidated=True, etag=etag, last_modified=last_modified)
+        metrics.incr('http_cache.same_body')
+        return 200, json.loads(entry['parsed'])
+    metrics.incr('http_cache.miss')
+    parsed = parse(response.text)
+    if cache:
+        cache.store(url, etag, last_modified, body_hash, json.dumps(parsed), version)
+    return 200, parsed
+
+# Job board plugins: name -> generator function taking `limit` and yielding job dicts
+# ({'title', 'url', 'description', 'company', 'location', 'published'})
+SOURCES = {}
+
+def register_source(name, timeout=SOURCE_TIMEOUT):
+    def decorator(fetch):
+        SOURCES[name] = {'fetch': fetch, 'timeout': timeout}
+        return fetch
+    return decorator
+
+def listing_page_url(page):
+    return f'{MYJOBMAG_BASE}/jobs' if page == 1 else f'{MYJOBMAG_BASE}/jobs?page={page}'
+
+def parse_listing_heuristic(markup, url):
+    # Slow generic fallback: class-name guessing over the whole BeautifulSoup tree
+    from bs4 import BeautifulSoup
     jobs = []
-    url = 'https://www.myjobmag.co.ke/jobs'
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'}
-    response = requests.get(url, headers=headers)
-    print(f"MyJobMag Response Status: {response.status_code}")
-    if response.status_code == 200:
-        soup = BeautifulSoup(response.text, 'lxml')
-        job_cards = soup.find_all('div', class_=re.compile(r'job|listing|item', re.I), limit=limit * 3)
-        for card in job_cards:
-            title_elem = card.find(['h3', 'h2', 'a', 'span'], class_=re.compile(r'title|job', re.I))
-            title = title_elem.text.strip() if title_elem else ''
-            if title and len(title) > 10:
-                link_elem = card.find('a', href=True)
-                link = 'https://www.myjobmag.co.ke' + link_elem['href'] if link_elem and not link_elem['href'].startswith('http') else link_elem['href'] if link_elem else url
-                desc_elem = card.find(['p', 'div'], class_=re.compile(r'desc|summary', re.I))
-                desc = desc_elem.text.strip()[:500] + '...' if desc_elem else 'Exciting Kenyan opportunity. Apply for full details.'
-                company_elem = card.find(['span', 'div'], class_=re.compile(r'company|employer', re.I))
-                company = company_elem.text.strip() if company_elem else 'MyJobMag Partner'
-                location_elem = card.find(['span', 'div'], class_=re.compile(r'location|place', re.I))
-                location = location_elem.text.strip() if location_elem else 'Nairobi, Kenya'
-                jobs.append({
-                    'title': title,
-                    'url': link,
-                    'description': desc,
-                    'company': company,
-                    'location': location,
-                    'published': str(datetime.now())
-                })
-    time.sleep(2)  # Polite delay
-    return jobs[:limit]
+    published = str(datetime.now())
+    soup = BeautifulSoup(markup, 'lxml')
+    job_cards = soup.find_all('div', class_=re.compile(r'job|listing|item', re.I))
+    for card in job_cards:
+        title_elem = card.find(['h3', 'h2', 'a', 'span'], class_=re.compile(r'title|job', re.I))
+        title = title_elem.text.strip() if title_elem else ''
+        if title and len(title) > 10:
+            link_elem = card.find('a', href=True)
+            link = MYJOBMAG_BASE + link_elem['href'] if link_elem and not link_elem['href'].startswith('http') else link_elem['href'] if link_elem else url
+            desc_elem = card.find(['p', 'div'], class_=re.compile(r'desc|summary', re.I))
+            desc = desc_elem.text.strip()[:500] + '...' if desc_elem else 'Exciting Kenyan opportunity. Apply for full details.'
+            company_elem = card.find(['span', 'div'], class_=re.compile(r'company|employer', re.I))
+            company = company_elem.text.strip() if company_elem else 'MyJobMag Partner'
+            location_elem = card.find(['span', 'div'], class_=re.compile(r'location|place', re.I))
+            location = location_elem.text.strip() if location_elem else 'Nairobi, Kenya'
+            jobs.append({
+                'title': title,
+                'url': link,
+                'description': desc,
+                'company': company,
+                'location': location,
+                'published': published
+            })
+    return jobs
 
-def fetch_improved_jobs(limit=40):
-    jobs = fetch_myjobmag_jobs(limit)
-    if len(jobs) < limit:
-        fallback = [
-            {
-                'title': 'Finance Manager - MyJobMag Sample',
-                'url': 'https://www.myjobmag.co.ke/job/finance-manager-nairobi',
-                'description': 'Lead financial operations for a growing Kenyan firm...',
-                'company': 'Sample Corp',
-                'location': 'Nairobi, Kenya',
-                'published': str(datetime.now())
-            }
-        ]
-        jobs += fallback[:limit - len(jobs)]
-    print(f"Fetched {len(jobs)} jobs from MyJobMag.")
+class LazyXPath:
+    # Compiled on first use in each thread: keeps lxml out of module import, and
+    # compiled XPath objects are not shared between threads
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+
+    def __call__(self, node):
+        compiled = getattr(self.local, 'compiled', None)
+        if compiled is None:
+            from lxml import etree
+            compiled = self.local.compiled = etree.XPath(self.path)
+        return compiled(node)
+
+# Selectors for MyJobMag's job-card markup:
+# <li class="job-list-li"> ... <li class="mag-b"><h2><a href="/job/...">Title at Company</a></h2></li>
+#   <li class="job-desc">...</li> ... </li>
+CARD_XPATH = LazyXPath("//li[contains(concat(' ', normalize-space(@class), ' '), ' job-list-li ')]")
+CARD_LINK_XPATH = LazyXPath("(.//li[contains(@class, 'mag-b')]//a[@href])[1]")
+CARD_DESC_XPATH = LazyXPath("normalize-space(.//li[contains(@class, 'job-desc')])")
+CARD_LOGO_ALT_XPATH = LazyXPath("normalize-space((.//div[contains(@class, 'job-logo')]//img/@alt)[1])")
+
+def parse_listing_fast(markup, url):
+    jobs = []
+    published = str(datetime.now())
+    import lxml.html
+    tree = lxml.html.fromstring(markup)
+    for card in CARD_XPATH(tree):
+        links = CARD_LINK_XPATH(card)
+        if not links:
+            continue
+        link = links[0]
+        title = link.text_content().strip()
+        if len(title) <= 10:
+            continue
+        href = link.get('href')
+        desc = CARD_DESC_XPATH(card)
+        # Cards read "<role> at <employer>"; the logo alt text is the next best source
+        company = title.rsplit(' at ', 1)[1].strip() if ' at ' in title else CARD_LOGO_ALT_XPATH(card)
+        jobs.append({
+            'title': title,
+            'url': href if href.startswith('http') else MYJOBMAG_BASE + href,
+            'description': desc[:500] + '...' if desc else 'Exciting Kenyan opportunity. Apply for full details.',
+            'company': company or 'MyJobMag Partner',
+            'location': 'Nairobi, Kenya',
+            'published': published
+        })
     return jobs
 
-def format_job_post(job):
-    title = job['title']
-    company = job['company']
-    location = job['location']
-    description = job['description']
-    published = job['published']
-    salary = 'KSh 80,000 - 120,000' if 'Finance' in title else 'Negotiable'
-    deadline = (datetime.strptime(published, '%Y-%m-%d %H:%M:%S.%f') + timedelta(days=30)).strftime('%d %B %Y')
-
-    # Tailored duties (10-15 items based on title keywords)
-    if any(word in title.lower() for word in ['finance', 'officer', 'compliance', 'manager']):
-        duties = [
-            'Conduct thorough audits of financial records to ensure accuracy and compliance.',
-            'Develop and implement internal control policies to mitigate organizational risks.',
-            'Monitor adherence to Kenyan legal and regulatory requirements.',
-            'Prepare detailed reports on compliance status for senior management review.',
-            'Collaborate with project teams to align controls with business goals.',
-            'Train staff on compliance protocols and ethical business practices.',
-            'Investigate discrepancies or potential fraud within the organization.',
-            'Liaise with external auditors during annual financial reviews.',
-            'Update compliance documentation in line with evolving regulations.',
-            'Assess the effectiveness of existing control measures regularly.',
-            'Provide guidance on policy interpretation to departmental heads.',
-            'Ensure timely resolution of all compliance-related issues.',
-            'Support the development of comprehensive risk management strategies.',
-            'Maintain strict confidentiality of sensitive financial data.'
-        ]
-    else:
-        duties = [
-            'Design and align technology solutions with core business needs.',
-            'Develop integrated views of enterprise architecture for scalability.',
-            'Collaborate with stakeholders to define and refine IT strategies.',
-            'Evaluate and recommend emerging technologies for adoption.',
-            'Oversee the implementation of architectural frameworks and standards.',
-            'Ensure system scalability and optimal performance across operations.',
-            'Conduct risk assessments on all proposed IT projects.',
-            'Provide technical guidance and support to development teams.',
-            'Maintain up-to-date documentation of architectural designs.',
-            'Liaise with vendors for seamless technology solutions integration.',
-            'Monitor industry trends to inform proactive strategy adjustments.',
-            'Support digital transformation initiatives within the organization.',
-            'Ensure full compliance with IT governance and security standards.'
-        ]
-
-    # Tailored qualifications (5-10 items)
-    if any(word in title.lower() for word in ['finance', 'officer', 'compliance', 'manager']):
-        quals = [
-            'Bachelor’s degree in Finance, Accounting, or a related field.',
-            'Minimum of 3 years’ experience in compliance or internal auditing.',
-            'Professional certification in risk management or internal auditing (e.g., CIA, CRMA).',
-            'Strong analytical skills with keen attention to detail.',
-            'Proficiency in financial software and Microsoft Office Suite.',
-            'Knowledge of Kenyan financial regulations and standards.',
-            'Excellent communication and interpersonal skills.',
-            'Ability to work independently in high-pressure environments.',
-            'Experience in a development or NGO setting is highly advantageous.'
-        ]
-    else:
-        quals = [
-            'Bachelor’s degree in Computer Science, IT, or equivalent.',
-            'At least 5 years’ experience in enterprise architecture or IT.',
-            'Familiarity with IT governance frameworks (e.g., TOGAF, Zachman).',
-            'Strong problem-solving and technical aptitude.',
-            'Hands-on experience with cloud computing platforms (e.g., AWS, Azure).',
-            'Excellent project management and stakeholder collaboration skills.',
-            'Ability to translate complex technical concepts to business language.',
-            'Proven track record in digital transformation projects.'
-        ]
+LISTING_PARSER_VERSION = 1  # Bump when parse_myjobmag_listing's output changes
 
-    # SEO Enhancements
-    meta_keywords = 'jobs in Kenya, Nairobi jobs, ' + ', '.join([word for word in [title, company, location.split(',')[0], 'employment', 'careers'] if word])
-    meta_description = f"Explore the {title} role at {company} in {location}. Apply by {deadline} for a salary of {salary}. Join Kenya's leading job opportunities!"
+def parse_myjobmag_listing(markup, url):
+    jobs = parse_listing_fast(markup, url)
+    if not jobs:
+        # Markup changed or the page is not a standard listing; fall back to guessing
+        metrics.incr('parse.heuristic_fallback')
+        jobs = parse_listing_heuristic(markup, url)
+    return jobs
+
+def fetch_listing_page(session, page):
+    # Returns the page's jobs, [] once we run past the last page, None on a transient failure
+    import requests
+    url = listing_page_url(page)
+    parse = metrics.timed('parse.listing_page', lambda markup: parse_myjobmag_listing(markup, url))
+    try:
+        with metrics.timer('fetch.listing_page'):
+            status, jobs = cached_get(session, url, parse, version=LISTING_PARSER_VERSION)
+    except requests.RequestException as e:
+        print(f"MyJobMag page {page} failed: {e}")
+        metrics.incr('fetch.listing_page_errors')
+        return None
+    print(f"MyJobMag page {page} Response Status: {status}")
+    if status == 404:
+        return []
+    if jobs:
+        # 'published' is when this run saw the job, not when the page was first parsed
+        published = str(datetime.now())
+        jobs = [{**job, 'published': published} for job in jobs]
+    return jobs
+
+@register_source('myjobmag')
+def iter_myjobmag_jobs(limit=40, concurrency=FETCH_CONCURRENCY, max_pages=MAX_LISTING_PAGES):
+    # Yields unique jobs as soon as their listing page has been parsed
+    seen = set()
+    session = get_session()
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    next_page = 1
+    try:
+        # Keep `concurrency` pages in flight, consume them in page order
+        while next_page <= max_pages and len(pending) < concurrency:
+            pending.append(pool.submit(fetch_listing_page, session, next_page))
+            next_page += 1
+        failures = 0
+        while pending:
+            page_jobs = pending.popleft().result()
+            if page_jobs == []:
+                break  # Past the last listing page
+            failures = failures + 1 if page_jobs is None else 0
+            if failures >= MAX_PAGE_FAILURES:
+                print(f"Giving up on MyJobMag after {failures} failed pages in a row.")
+                break
+            if next_page <= max_pages:
+                pending.append(pool.submit(fetch_listing_page, session, next_page))
+                next_page += 1
+            for job in page_jobs or []:
+                key = (job['url'], job['title'])
+                if key not in seen:
+                    seen.add(key)
+                    yield job
+                    if len(seen) >= limit:
+                        return
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def fetch_myjobmag_jobs(limit=40, concurrency=FETCH_CONCURRENCY, max_pages=MAX_LISTING_PAGES):
+    return list(iter_myjobmag_jobs(limit, concurrency, max_pages))
+
+# Detail page selectors: description body, the "key info" list and the employer link
+DETAIL_DESC_XPATH = LazyXPath("(//div[contains(@class, 'job-details')] | //div[@id='printable'])[1]")
+DETAIL_KEY_INFO_XPATH = LazyXPath("//ul[contains(@class, 'job-key-info')]/li")
+DETAIL_KEY_XPATH = LazyXPath("normalize-space(.//*[contains(@class, 'jkey-title')])")
+DETAIL_VALUE_XPATH = LazyXPath("normalize-space(.//*[contains(@class, 'jkey-info')])")
+DETAIL_EMPLOYER_XPATH = LazyXPath("normalize-space((//a[contains(@href, '/jobs-at/')])[1])")
+DEADLINE_RE = re.compile(r'Deadline\s*:?\s*([A-Za-z]+\.? \d{1,2},? \d{4}|\d{1,2}(?:st|nd|rd|th)? [A-Za-z]+,? \d{4}|\d{4}-\d{2}-\d{2})')
+DEADLINE_FORMATS = ['%B %d %Y', '%b %d %Y', '%d %B %Y', '%d %b %Y', '%Y-%m-%d']
+
+def parse_deadline(text):
+    text = re.sub(r'(?<=\d)(st|nd|rd|th)\b', '', text.replace(',', '').replace('.', ''))
+    for fmt in DEADLINE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date().isoformat()
+        except ValueError:
+            pass
+    return None
+
+DETAIL_PARSER_VERSION = 1  # Bump when parse_job_details's output changes
+
+def parse_job_details(markup):
+    # Only returns the fields the page actually provides
+    details = {}
+    import lxml.html
+    tree = lxml.html.fromstring(markup)
+    desc = DETAIL_DESC_XPATH(tree)
+    if desc:
+        text = re.sub(r'\s+', ' ', ' '.join(desc[0].itertext())).strip()  # Keep paragraphs apart
+        if text:
+            details['description'] = text[:DETAIL_DESCRIPTION_CHARS] + ('...' if len(text) > DETAIL_DESCRIPTION_CHARS else '')
+    info = {DETAIL_KEY_XPATH(li).rstrip(':').lower(): DETAIL_VALUE_XPATH(li) for li in DETAIL_KEY_INFO_XPATH(tree)}
+    if info.get('location'):
+        details['location'] = info['location'] if ',' in info['location'] else info['location'] + ', Kenya'
+    salary = info.get('salary') or info.get('salary range')
+    if salary:
+        details['salary'] = salary
+    employer = info.get('company') or info.get('employer') or DETAIL_EMPLOYER_XPATH(tree)
+    if employer:
+        details['company'] = employer
+    match = DEADLINE_RE.search(tree.text_content())
+    deadline = parse_deadline(match.group(1)) if match else None
+    if deadline:
+        details['deadline'] = deadline
+    return details
+
+def fetch_job_details(session, job):
+    # Returns the job updated from its detail page, or unchanged if the page can't be read
+    try:
+        with metrics.timer('fetch.detail_page'):
+            status, details = cached_get(session, job['url'], metrics.timed('parse.detail_page', parse_job_details), ttl=DETAIL_CACHE_TTL, version=DETAIL_PARSER_VERSION)
+        if status != 200:
+            print(f"Detail page {job['url']} Response Status: {status}")
+            return job
+        return {**job, **details}
+    except Exception as e:
+        print(f"Detail page {job['url']} failed: {e}")
+        metrics.incr('fetch.detail_page_errors')
+        return job
+
+def iter_enriched_jobs(jobs, concurrency=DETAIL_CONCURRENCY):
+    # Fetches detail pages with at most `concurrency` in flight, yielding jobs as they complete
+    session = get_session()
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    pending = set()
+    try:
+        for job in jobs:
+            pending.add(pool.submit(fetch_job_details, session, job))
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def canonical_url(url):
+    # Lower-case scheme/host, drop query string, fragment and trailing slash
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
+def normalize_text(text):
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+def job_key(job):
+    # Stable across processes, unlike hash(); ignores the per-run 'published' field.
+    # A key pinned at listing time wins, so detail-page enrichment can't change it.
+    if 'key' in job:
+        return job['key']
+    return _job_key(job['url'], job['title'], job['company'])
+
+@functools.lru_cache(maxsize=4096)
+def _job_key(url, title, company):
+    raw = '\n'.join([canonical_url(url), normalize_text(title), normalize_text(company)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+SYNC_COLUMNS = [
+    ('fingerprint', 'TEXT'),  # Hash of the job fields a post is rendered from
+    ('title_hash', 'TEXT'),  # Hashes of the post title/content as last sent to Blogger
+    ('content_hash', 'TEXT'),
+    ('job_published', 'TEXT'),  # The job's original 'published' value, so re-renders stay stable
+    ('deadline', 'TEXT'),
+    ('status', "TEXT NOT NULL DEFAULT 'live'"),  # 'live', 'expired' or 'unconfirmed' (insert got no answer)
+]
+
+FINGERPRINT_FIELDS = ('title', 'description', 'company', 'location', 'salary', 'deadline')
+
+def job_fingerprint(job):
+    data = json.dumps([job.get(field) for field in FINGERPRINT_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def job_deadline(job):
+    # Scraped deadline if the detail page had one, else 30 days after the job was first seen
+    if job.get('deadline'):
+        return datetime.fromisoformat(job['deadline'])
+    return (datetime.fromisoformat(job['published']) + timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+class JobIndex:
+    def __init__(self, path=JOB_INDEX_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS published_jobs ('
+                ' job_key TEXT PRIMARY KEY,'
+                ' url TEXT NOT NULL,'
+                ' title TEXT NOT NULL,'
+                ' company TEXT NOT NULL,'
+                ' post_id TEXT,'
+                ' post_url TEXT,'
+                ' published_at TEXT NOT NULL)'
+            )
+            self.conn.execute('CREATE INDEX IF NOT EXISTS published_jobs_published_at ON published_jobs (published_at)')
+            # Sync columns, added in place to indexes created before they existed
+            columns = {row[1] for row in self.conn.execute('PRAGMA table_info(published_jobs)')}
+            for column, kind in SYNC_COLUMNS:
+                if column not in columns:
+                    self.conn.execute(f'ALTER TABLE published_jobs ADD COLUMN {column} {kind}')
+            self.conn.execute("UPDATE published_jobs SET deadline = date(published_at, '+30 days') WHERE deadline IS NULL")
+            self.conn.execute('CREATE INDEX IF NOT EXISTS published_jobs_deadline ON published_jobs (status, deadline)')
+
+    def seen_keys(self, keys):
+        keys = list(keys)
+        found = set()
+        with self.lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self.conn.execute(
+                    f'SELECT job_key FROM published_jobs WHERE job_key IN ({",".join("?" * len(chunk))})', chunk
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    def seen_since(self, since):
+        # Keys of every job published on or after `since` (date or datetime)
+        with self.lock:
+            rows = self.conn.execute('SELECT job_key FROM published_jobs WHERE published_at >= ?', (since.isoformat(),))
+            return {row[0] for row in rows}
 
-    content = f"""
+    def lookup(self, key):
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT post_id, fingerprint, title_hash, content_hash, job_published, published_at, status'
+                ' FROM published_jobs WHERE job_key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('post_id', 'fingerprint', 'title_hash', 'content_hash', 'job_published', 'published_at', 'status'), row))
+
+    def mark_published(self, job, response=None, body=None, status='live'):
+        response = response or {}
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO published_jobs (job_key, url, title, company, post_id, post_url, published_at,'
+                ' fingerprint, title_hash, content_hash, job_published, deadline, status)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (job_key(job), canonical_url(job['url']), job['title'], job['company'],
+                 response.get('id'), response.get('url'), datetime.now().isoformat(),
+                 job_fingerprint(job), text_hash(body['title']) if body else None,
+                 text_hash(body['content']) if body else None, job['published'],
+                 job_deadline(job).date().isoformat(), status)
+            )
+
+    def mark_synced(self, job, body):
+        # Records what the live post now holds after a patch (or a first sync)
+        with self.lock, self.conn:
+            self.conn.execute(
+                'UPDATE published_jobs SET fingerprint = ?, title_hash = ?, content_hash = ?, job_published = ?, deadline = ?'
+                ' WHERE job_key = ?',
+                (job_fingerprint(job), text_hash(body['title']), text_hash(body['content']), job['published'],
+                 job_deadline(job).date().isoformat(), job_key(job))
+            )
+
+    def expired(self, today):
+        # (job_key, post_id) of live posts whose deadline is before `today`
+        with self.lock:
+            return self.conn.execute(
+                "SELECT job_key, post_id FROM published_jobs WHERE status = 'live' AND post_id IS NOT NULL"
+                ' AND deadline < ?', (today.isoformat(),)
+            ).fetchall()
+
+    def mark_expired(self, keys):
+        with self.lock, self.conn:
+            self.conn.executemany("UPDATE published_jobs SET status = 'expired' WHERE job_key = ?", [(key,) for key in keys])
+
+    def close(self):
+        self.conn.close()
+
+def sample_jobs():
+    return [
+        {
+            'title': 'Finance Manager - MyJobMag Sample',
+            'url': 'https://www.myjobmag.co.ke/job/finance-manager-nairobi',
+            'description': 'Lead financial operations for a growing Kenyan firm...',
+            'company': 'Sample Corp',
+            'location': 'Nairobi, Kenya',
+            'published': str(datetime.now())
+        }
+    ]
+
+def merge_key(job):
+    # The same vacancy on two boards has different URLs, so boards are matched on title
+    # and employer. Within one board, different URLs are different vacancies.
+    return normalize_text(job['title']), normalize_text(job['company'])
+
+def iter_source_jobs(limit=40, sources=None, deadline=SOURCES_DEADLINE):
+    # Runs every source in its own thread and yields merged, de-duplicated jobs as
+    # they arrive. Timeouts are judged by when a job arrived, not when it is read, so
+    # a slow consumer never discards work a source finished in time. A source past its
+    # own timeout is abandoned, and the whole fan-out ends at `deadline` or `limit`
+    # jobs, whatever the slowest board is doing.
+    names = list(sources or SOURCES)
+    results = queue.Queue()
+    stops = {name: threading.Event() for name in names}  # Set once a source is no longer wanted
+
+    def run(name):
+        jobs = ()
+        try:
+            jobs = SOURCES[name]['fetch'](limit)
+            for job in jobs:
+                if stops[name].is_set():
+                    break
+                results.put((name, job, time.monotonic()))
+        except Exception as e:
+            print(f"Source {name} failed: {e}")
+        finally:
+            getattr(jobs, 'close', lambda: None)()
+            results.put((name, _DONE, time.monotonic()))
+
+    started = time.monotonic()
+    end = started + deadline
+    ends = {name: min(started + SOURCES[name]['timeout'], end) for name in names}
+
+    def abandon(name):
+        # Stops the source's crawl too, so it no longer competes for hosts and sessions
+        stops[name].set()
+        del ends[name]
+        if SOURCES[name]['timeout'] < deadline:
+            print(f"Source {name} timed out after {SOURCES[name]['timeout']:g}s")
+        else:
+            print(f"Source deadline of {deadline:g}s reached; skipping {name}")
+
+    for name in names:
+        threading.Thread(target=run, args=(name,), name=f'source-{name}', daemon=True).start()
+    urls = set()
+    boards = {}  # merge_key -> the source that listed it first
+    count = 0
+    try:
+        while ends:
+            try:
+                name, job, arrived = results.get(timeout=max(0, min(ends.values()) - time.monotonic()))
+            except queue.Empty:
+                # Nothing queued that arrived in time; sources past their end are abandoned
+                now = time.monotonic()
+                for name in [name for name, source_end in ends.items() if source_end <= now]:
+                    abandon(name)
+                continue
+            if name not in ends:
+                continue  # Late result from a source that was already abandoned
+            if arrived > ends[name]:
+                abandon(name)
+                continue
+            if job is _DONE:
+                del ends[name]
+                continue
+            url = canonical_url(job['url'])
+            if url in urls or boards.setdefault(merge_key(job), name) != name:
+                continue
+            urls.add(url)
+            count += 1
+            metrics.incr(f'source.{name}.jobs')
+            yield job
+            if count >= limit:
+                break
+    finally:
+        for stop in stops.values():
+            stop.set()
+
+def iter_improved_jobs(limit=40):
+    count = 0
+    for job in iter_source_jobs(limit):
+        count += 1
+        yield job
+    if count < limit:
+        for job in sample_jobs()[:limit - count]:
+            count += 1
+            yield job
+    print(f"Fetched {count} jobs from {', '.join(SOURCES)}.")
+
+def fetch_improved_jobs(limit=40):
+    return list(iter_improved_jobs(limit))
+
+# Post template: compiled once at import, rendering only fills in escaped job fields
+FINANCE_KEYWORDS = ('finance', 'officer', 'compliance', 'manager')
+SUMMARY_KEYWORDS = ('finance', 'officer', 'compliance')
+NGO_KEYWORDS = ('giz', 'ngo')
+
+FINANCE_DUTIES = [
+    'Conduct thorough audits of financial records to ensure accuracy and compliance.',
+    'Develop and implement internal control policies to mitigate organizational risks.',
+    'Monitor adherence to Kenyan legal and regulatory requirements.',
+    'Prepare detailed reports on compliance status for senior management review.',
+    'Collaborate with project teams to align controls with business goals.',
+    'Train staff on compliance protocols and ethical business practices.',
+    'Investigate discrepancies or potential fraud within the organization.',
+    'Liaise with external auditors during annual financial reviews.',
+    'Update compliance documentation in line with evolving regulations.',
+    'Assess the effectiveness of existing control measures regularly.',
+    'Provide guidance on policy interpretation to departmental heads.',
+    'Ensure timely resolution of all compliance-related issues.',
+    'Support the development of comprehensive risk management strategies.',
+    'Maintain strict confidentiality of sensitive financial data.'
+]
+TECH_DUTIES = [
+    'Design and align technology solutions with core business needs.',
+    'Develop integrated views of enterprise architecture for scalability.',
+    'Collaborate with stakeholders to define and refine IT strategies.',
+    'Evaluate and recommend emerging technologies for adoption.',
+    'Oversee the implementation of architectural frameworks and standards.',
+    'Ensure system scalability and optimal performance across operations.',
+    'Conduct risk assessments on all proposed IT projects.',
+    'Provide technical guidance and support to development teams.',
+    'Maintain up-to-date documentation of architectural designs.',
+    'Liaise with vendors for seamless technology solutions integration.',
+    'Monitor industry trends to inform proactive strategy adjustments.',
+    'Support digital transformation initiatives within the organization.',
+    'Ensure full compliance with IT governance and security standards.'
+]
+FINANCE_QUALS = [
+    'Bachelor’s degree in Finance, Accounting, or a related field.',
+    'Minimum of 3 years’ experience in compliance or internal auditing.',
+    'Professional certification in risk management or internal auditing (e.g., CIA, CRMA).',
+    'Strong analytical skills with keen attention to detail.',
+    'Proficiency in financial software and Microsoft Office Suite.',
+    'Knowledge of Kenyan financial regulations and standards.',
+    'Excellent communication and interpersonal skills.',
+    'Ability to work independently in high-pressure environments.',
+    'Experience in a development or NGO setting is highly advantageous.'
+]
+TECH_QUALS = [
+    'Bachelor’s degree in Computer Science, IT, or equivalent.',
+    'At least 5 years’ experience in enterprise architecture or IT.',
+    'Familiarity with IT governance frameworks (e.g., TOGAF, Zachman).',
+    'Strong problem-solving and technical aptitude.',
+    'Hands-on experience with cloud computing platforms (e.g., AWS, Azure).',
+    'Excellent project management and stakeholder collaboration skills.',
+    'Ability to translate complex technical concepts to business language.',
+    'Proven track record in digital transformation projects.'
+]
+
+POST_TEMPLATE = """
     <h1>Job Vacancies at <b>{company}</b> – Apply Now!</h1>
     <!-- Meta Data -->
     <meta name="keywords" content="{meta_keywords}">
     <meta name="description" content="{meta_description}">
     <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org/",
-        "@type": "JobPosting",
-        "title": "{title}",
-        "description": "{description}",
-        "identifier": {{
-            "@type": "PropertyValue",
-            "name": "{company}",
-            "value": "JobID-{hash(str(job))}"
-        }},
-        "datePosted": "{published}",
-        "validThrough": "{datetime.strptime(deadline, '%d %B %Y').isoformat()}",
-        "employmentType": "FULL_TIME",
-        "hiringOrganization": {{
-            "@type": "Organization",
-            "name": "{company}",
-            "sameAs": "{job['url']}"
-        }},
-        "jobLocation": {{
-            "@type": "Place",
-            "address": {{
-                "@type": "PostalAddress",
-                "addressLocality": "{location.split(',')[0]}",
-                "addressRegion": "Kenya",
-                "addressCountry": "KE"
-            }}
-        }},
-        "baseSalary": {{
-            "@type": "MonetaryAmount",
-            "currency": "KES",
-            "value": {{
-                "@type": "QuantitativeValue",
-                "minValue": {salary.split('-')[0].replace('KSh ', '')},
-                "maxValue": {salary.split('-')[1].replace('KSh ', '') if '-' in salary else salary.replace('KSh ', '')},
-                "unitText": "MONTH"
-            }}
-        }}
-    }}
+{json_ld}
     </script>
 
     <h2>Introduction</h2>
-    <p>{company}, a renowned organization in the {'development and cooperation' if any(w in company.lower() for w in ['giz', 'ngo']) else 'business and finance'} sector, is expanding its operations in Kenya with a focus on sustainable growth and innovation. Established over decades ago, it has built a strong reputation for delivering impactful projects in areas like {'healthcare, education, and economic development' if any(w in company.lower() for w in ['giz', 'ngo']) else 'financial services and technology'}. Operating primarily from its <i>{location.split(',')[0]}</i> office, {company} collaborates with local and global partners to address key challenges in the region.</p>
-    <p>This recruitment drive offers a chance to join a dynamic team committed to excellence and community impact. With a mission to foster inclusive {'development and cooperation' if any(w in company.lower() for w in ['giz', 'ngo']) else 'financial inclusion and innovation'}, {company} is seeking talented individuals to contribute to its initiatives across Kenya.</p>
+    <p>{company}, a renowned organization in the {sector} sector, is expanding its operations in Kenya with a focus on sustainable growth and innovation. Established over decades ago, it has built a strong reputation for delivering impactful projects in areas like {impact_areas}. Operating primarily from its <i>{city}</i> office, {company} collaborates with local and global partners to address key challenges in the region.</p>
+    <p>This recruitment drive offers a chance to join a dynamic team committed to excellence and community impact. With a mission to foster inclusive {mission}, {company} is seeking talented individuals to contribute to its initiatives across Kenya.</p>
 
     <h2>{title}</h2>
     <h3>Job Overview</h3>
@@ -220,11 +916,11 @@ def format_job_post(job):
     </ul>
 
     <h3>Job Summary</h3>
-    <p>{company} is seeking a dedicated <b>{title}</b> to ensure robust oversight and innovation in {location}. This role involves critical responsibilities in {'compliance and risk management' if any(w in title.lower() for w in ['finance', 'officer', 'compliance']) else 'enterprise architecture and IT strategy'}, supporting key projects with precision. Join a team driving impactful change in Kenya's {'development landscape' if any(w in title.lower() for w in ['finance', 'officer', 'compliance']) else 'financial technology sector'}.</p>
+    <p>{company} is seeking a dedicated <b>{title}</b> to ensure robust oversight and innovation in {location}. This role involves critical responsibilities in {focus}, supporting key projects with precision. Join a team driving impactful change in Kenya's {landscape}.</p>
 
     <h3>Duties & Responsibilities</h3>
     <ul>
-        {''.join([f'<li>{duty}</li>' for duty in duties])}
+        {duties}
     </ul>
 
     <!---WhatsApp Channel Banner--->
@@ -233,11 +929,11 @@ def format_job_post(job):
 
     <h3>Qualifications & Requirements</h3>
     <ul>
-        {''.join([f'<li>{qual}</li>' for qual in quals])}
+        {quals}
     </ul>
 
     <h3>How to Apply</h3>
-    <p>Interested candidates should submit their <b>CV</b>, <b>cover letter</b>, and copies of certifications to <b>hr@{company.lower().replace(' ', '')}.org</b> by {deadline}. Ensure all documents are in PDF format and include <i>{title} Application</i> in the subject line.</p>
+    <p>Interested candidates should submit their <b>CV</b>, <b>cover letter</b>, and copies of certifications to <b>{apply_email}</b> by {deadline}. Ensure all documents are in PDF format and include <i>{title} Application</i> in the subject line.</p>
 
     <!---COVER LETTER GENERATOR BUTTON STARTS HERE--->
     <div class="bg-green-100 border-l-4 border-green-500 p-4 mb-6 rounded-lg text-center"><p class="font-semibold text-lg text-gray-800" style="text-align: center;"><span style="text-align: left;">🔹</span><b><span style="color: #38761d;">Create a Winning Cover Letter in</span><span style="color: #3d85c6;"> 1 Minute!</span><span style="color: #38761d;"> Pay Ksh 36 to Download Now!</span></b><span style="text-align: left;">🔹</span></p></div>
@@ -292,30 +988,398 @@ def format_job_post(job):
     <h2>Call-to-Action</h2>
     <p>Don’t miss out on this exciting opportunity with <b>{company}</b>! Apply today before the deadline of {deadline} and take the first step toward a rewarding career.</p>
     """
-    return content
-
-def publish_job_post(service, blog_id, job):
-    body = {
-        'kind': 'blogger#post',
-        'blog': {'id': blog_id},
-        'title': f'Job Vacancies at {job["company"]} – Apply Now!',
-        'content': format_job_post(job)
+
+def compile_template(template):
+    # Split into (literal, field) pairs so rendering is a single join
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+def html_list(items):
+    return ''.join([f'<li>{item}</li>' for item in items])
+
+COMPILED_POST = compile_template(POST_TEMPLATE)
+DUTIES_HTML = {True: html_list(FINANCE_DUTIES), False: html_list(TECH_DUTIES)}
+QUALS_HTML = {True: html_list(FINANCE_QUALS), False: html_list(TECH_QUALS)}
+
+def render_template(compiled, fields):
+    return ''.join([literal + fields[field] if field is not None else literal for literal, field in compiled])
+
+def has_keyword(text, keywords):
+    text = text.lower()
+    return any(word in text for word in keywords)
+
+def salary_range(salary):
+    # 'KSh 80,000 - 120,000' -> (80000, 120000); None when not a figure
+    values = [int(v.replace(',', '')) for v in re.findall(r'\d[\d,]*', salary)]
+    if not values:
+        return None
+    return values[0], values[-1]
+
+def job_posting_json_ld(job, deadline, salary):
+    city = job['location'].split(',')[0]
+    data = {
+        '@context': 'https://schema.org/',
+        '@type': 'JobPosting',
+        'title': job['title'],
+        'description': job['description'],
+        'identifier': {
+            '@type': 'PropertyValue',
+            'name': job['company'],
+            'value': f'JobID-{job_key(job)[:16]}'
+        },
+        'datePosted': job['published'],
+        'validThrough': deadline.isoformat(),
+        'employmentType': 'FULL_TIME',
+        'hiringOrganization': {
+            '@type': 'Organization',
+            'name': job['company'],
+            'sameAs': job['url']
+        },
+        'jobLocation': {
+            '@type': 'Place',
+            'address': {
+                '@type': 'PostalAddress',
+                'addressLocality': city,
+                'addressRegion': 'Kenya',
+                'addressCountry': 'KE'
+            }
+        }
     }
+    salary_values = salary_range(salary)
+    if salary_values:
+        data['baseSalary'] = {
+            '@type': 'MonetaryAmount',
+            'currency': 'KES',
+            'value': {
+                '@type': 'QuantitativeValue',
+                'minValue': salary_values[0],
+                'maxValue': salary_values[1],
+                'unitText': 'MONTH'
+            }
+        }
+    # '</' would close the <script> element early
+    return json.dumps(data, ensure_ascii=False).replace('</', '<\\/')
+
+def format_job_post(job):
+    title = job['title']
+    company = job['company']
+    location = job['location']
+    salary = job.get('salary') or ('KSh 80,000 - 120,000' if 'Finance' in title else 'Negotiable')
+    deadline_date = job_deadline(job)
+    deadline = deadline_date.strftime('%d %B %Y')
+
+    finance_role = has_keyword(title, FINANCE_KEYWORDS)
+    compliance_role = has_keyword(title, SUMMARY_KEYWORDS)
+    ngo = has_keyword(company, NGO_KEYWORDS)
+
+    # Escape each field once and build everything else from the escaped values
+    title = html.escape(title)
+    company = html.escape(company)
+    location = html.escape(location)
+    salary_html = html.escape(salary)
+    city = location.split(',')[0]
+
+    # SEO Enhancements
+    meta_keywords = 'jobs in Kenya, Nairobi jobs, ' + ', '.join([word for word in [title, company, city, 'employment', 'careers'] if word])
+    meta_description = f"Explore the {title} role at {company} in {location}. Apply by {deadline} for a salary of {salary_html}. Join Kenya's leading job opportunities!"
+
+    return render_template(COMPILED_POST, {
+        'company': company,
+        'title': title,
+        'location': location,
+        'city': city,
+        'deadline': deadline,
+        'salary': salary_html,
+        'meta_keywords': meta_keywords,
+        'meta_description': meta_description,
+        'json_ld': job_posting_json_ld(job, deadline_date, salary),
+        'sector': 'development and cooperation' if ngo else 'business and finance',
+        'impact_areas': 'healthcare, education, and economic development' if ngo else 'financial services and technology',
+        'mission': 'development and cooperation' if ngo else 'financial inclusion and innovation',
+        'focus': 'compliance and risk management' if compliance_role else 'enterprise architecture and IT strategy',
+        'landscape': 'development landscape' if compliance_role else 'financial technology sector',
+        'duties': DUTIES_HTML[finance_role],
+        'quals': QUALS_HTML[finance_role],
+        'apply_email': f"hr@{company.lower().replace(' ', '')}.org",
+    })
+
+def build_post_body(blog_id, job):
+    with metrics.timer('render.job'):
+        return {
+            'kind': 'blogger#post',
+            'blog': {'id': blog_id},
+            'title': f'Job Vacancies at {job["company"]} – Apply Now!',
+            'content': format_job_post(job)
+        }
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+def blogger_limiter(batch_size=PUBLISH_BATCH_SIZE):
+    return TokenBucket(BLOGGER_REQUESTS_PER_MINUTE / 60, max(batch_size, 1))
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+def error_status(exception):
+    resp = getattr(exception, 'resp', None)
+    return getattr(resp, 'status', None)
+
+def is_connect_error(exception):
+    # Failed before anything was sent, so the API cannot have acted on the request
+    if isinstance(exception, (ConnectionRefusedError, socket.gaierror)):
+        return True
+    return type(exception).__name__ == 'ServerNotFoundError'  # httplib2's DNS failure
+
+def is_retryable(exception, idempotent=True):
+    # A 429/5xx answer is always safe to retry. Other transport errors (e.g. a read
+    # timeout) may come after the API already acted, so only idempotent calls retry them.
+    status = error_status(exception)
+    if status is not None:
+        return status in RETRYABLE_STATUSES
+    return idempotent or is_connect_error(exception)
+
+def execute_batched(service, payloads, make_request, limiter=None, batch_size=PUBLISH_BATCH_SIZE,
+                    max_attempts=MAX_PUBLISH_ATTEMPTS, idempotent=None):
+    # Runs make_request(payload) for every payload through batch HTTP requests.
+    # idempotent(payload) is False for calls that must not be repeated after an
+    # ambiguous transport error (inserts); by default every call is idempotent.
+    # Returns one outcome dict per payload, in order.
+    limiter = limiter or blogger_limiter(batch_size)
+    idempotent = idempotent or (lambda payload: True)
+    outcomes = [{'status': 'pending', 'response': None, 'error': None, 'http_status': None, 'attempts': 0} for _ in payloads]
+    todo = list(range(len(payloads)))
+    retry_round = 0
+    while todo:
+        retry = []
+
+        def callback(request_id, response, exception):
+            i = int(request_id)
+            outcome = outcomes[i]
+            outcome['attempts'] += 1
+            outcome['http_status'] = error_status(exception) if exception else 200
+            if exception is None:
+                outcome.update(status='ok', response=response, error=None)
+            elif is_retryable(exception, idempotent(payloads[i])) and outcome['attempts'] < max_attempts:
+                outcome['error'] = str(exception)
+                retry.append(i)
+                metrics.incr('blogger.retries')
+            else:
+                # A non-idempotent call that got no answer may still have gone through
+                unconfirmed = not idempotent(payloads[i]) and error_status(exception) is None and not is_connect_error(exception)
+                outcome.update(status='unconfirmed' if unconfirmed else 'failed', error=str(exception))
+                metrics.incr('blogger.unconfirmed' if unconfirmed else 'blogger.failures')
+
+        for start in range(0, len(todo), batch_size):
+            chunk = todo[start:start + batch_size]
+            with metrics.timer('blogger.throttle_wait'):
+                limiter.acquire(len(chunk))  # Every sub-request counts against the quota
+            metrics.incr('blogger.batches')
+            metrics.incr('blogger.calls', len(chunk))
+            metrics.incr('blogger.quota_used', len(chunk))
+            batch = service.new_batch_http_request(callback=callback)
+            for i in chunk:
+                batch.add(make_request(payloads[i]), request_id=str(i))
+            try:
+                with metrics.timer('publish.batch'):
+                    batch.execute()
+            except Exception as e:
+                # The batch as a whole failed (transport error, 5xx on the envelope); whether
+                # the API acted on it is only known for connect errors and HTTP answers
+                for i in chunk:
+                    if outcomes[i]['status'] == 'pending' and i not in retry:
+                        callback(str(i), None, e)
+        if retry:
+            delay = backoff_delay(retry_round)
+            print(f"Retrying {len(retry)} Blogger requests in {delay:.1f}s")
+            time.sleep(delay)
+            retry_round += 1
+        todo = sorted(retry)
+    return outcomes
+
+def post_request(service, blog_id, item):
+    if item['action'] == 'patch':
+        return service.posts().patch(blogId=blog_id, postId=item['post_id'], body=item['changes'])
+    return service.posts().insert(blogId=blog_id, body=item['body'])
+
+def apply_post_changes(service, blog_id, items, limiter=None, batch_size=PUBLISH_BATCH_SIZE):
+    # items: {'action': 'insert' | 'patch', 'job', 'body', and for patches 'post_id' and
+    # 'changes' (only the fields that differ)}. Inserts and patches share batches.
+    outcomes = execute_batched(
+        service, items,
+        lambda item: post_request(service, blog_id, item),
+        limiter=limiter, batch_size=batch_size,
+        idempotent=lambda item: item['action'] != 'insert'  # A repeated insert is a duplicate post
+    )
+    for item, outcome in zip(items, outcomes):
+        outcome.update(job=item['job'], action=item['action'], body=item['body'])
+        if outcome['status'] == 'unconfirmed':
+            print(f"No answer from Blogger for {item['job']['title']} ({outcome['error']}); the post may exist anyway, so it was not sent again.")
+        elif outcome['status'] != 'ok':
+            print(f"Failed to {item['action']} {item['job']['title']} after {outcome['attempts']} attempts: {outcome['error']}")
+        elif item['action'] == 'patch':
+            metrics.incr('blogger.patches')
+            print(f"Updated: {item['job']['title']} ({', '.join(item['changes'])})")
+        else:
+            print(f"Posted: {outcome['response']['title']} - Check at {outcome['response']['url']}")
+    return outcomes
+
+def expire_posts(service, blog_id, index, today=None, action=EXPIRE_ACTION, limiter=None):
+    # Unpublishes ('revert' to draft) or deletes every live post past its deadline, in batches
+    rows = index.expired(today or datetime.now().date())
+    if not rows:
+        return 0
+    posts = service.posts()
+    method = posts.delete if action == 'delete' else posts.revert
+    outcomes = execute_batched(
+        service, [post_id for _, post_id in rows],
+        lambda post_id: method(blogId=blog_id, postId=post_id),
+        limiter=limiter
+    )
+    # A post that is already gone counts as expired too
+    done = [key for (key, _), outcome in zip(rows, outcomes) if outcome['status'] == 'ok' or outcome['http_status'] == 404]
+    index.mark_expired(done)
+    metrics.incr('blogger.expired', len(done))
+    print(f"Expired {len(done)}/{len(rows)} posts past their deadline ({action}).")
+    return len(done)
+
+_DONE = object()
+
+def run_pipeline(source, transforms, sink, queue_size=PIPELINE_QUEUE_SIZE, batch_size=PUBLISH_BATCH_SIZE, linger=PUBLISH_LINGER):
+    # Streams items from `source` through each transform (one thread per stage,
+    # None drops the item) into `sink`, which is called on the main thread with
+    # batches of up to `batch_size` items. Bounded queues give backpressure; the
+    # first exception in any stage stops every stage and is re-raised here.
+    stop = threading.Event()
+    errors = []
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(transforms) + 1)]
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(q, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not stop.is_set():
+            wait = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+            if wait <= 0:
+                return None
+            try:
+                return q.get(timeout=wait)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def fail(e):
+        errors.append(e)
+        stop.set()
+
+    def produce():
+        try:
+            for item in source:
+                if not put(queues[0], item):
+                    break
+        except Exception as e:
+            fail(e)
+        finally:
+            getattr(source, 'close', lambda: None)()
+            put(queues[0], _DONE)
+
+    def transform(fn, inbox, outbox):
+        try:
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    break
+                result = fn(item)
+                if result is not None and not put(outbox, result):
+                    break
+        except Exception as e:
+            fail(e)
+        finally:
+            put(outbox, _DONE)
+
+    threads = [threading.Thread(target=produce, name='pipeline-source', daemon=True)]
+    for i, fn in enumerate(transforms):
+        threads.append(threading.Thread(target=transform, args=(fn, queues[i], queues[i + 1]),
+                                        name=f'pipeline-{getattr(fn, "__name__", i)}', daemon=True))
+    for thread in threads:
+        thread.start()
     try:
-        request = service.posts().insert(blogId=blog_id, body=body)
-        response = request.execute()
-        print(f"Posted: {response['title']} - Check at {response['url']}")
-        return response
-    except Exception as e:
-        print(f"Failed to post {job['title']}: {e}")
-        return None
+        inbox = queues[-1]
+        done = False
+        while not done:
+            item = get(inbox)
+            if item is _DONE:
+                break
+            batch = [item]
+            # Give upstream a moment to fill the batch before calling the sink
+            linger_until = time.monotonic() + linger
+            while len(batch) < batch_size:
+                item = get(inbox, max(linger_until - time.monotonic(), 0.001))
+                if item is None:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            sink(batch)
+    except BaseException as e:
+        fail(e)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=5)
+    if errors:
+        raise errors[0]
+
+def run_daily_job_posting(limit=40, dry_run=False, profile_path=None, service=None, sync=SYNC_POSTS):
+    # With profile_path, the whole run (all threads) is profiled into a pstats file.
+    # A prebuilt Blogger `service` skips authentication (used by the offline benchmarks).
+    if not profile_path:
+        return daily_job_posting(limit, dry_run, service, sync)
+    profiler = cProfile.Profile()
+    thread_profiles = profile_threads()
+    profiler.enable()
+    try:
+        return daily_job_posting(limit, dry_run, service, sync)
+    finally:
+        profiler.disable()
+        threading.setprofile(None)
+        stats = pstats.Stats(profiler)
+        for thread_profile in thread_profiles:
+            stats.add(thread_profile)
+        stats.dump_stats(profile_path)
+        print(f"Profile written to {profile_path}")
 
-def run_daily_job_posting():
-    service = authenticate()
-    if not service:
-        print("Authentication failed. Re-run authentication cell!")
-        return
-    
+def daily_job_posting(limit=40, dry_run=False, service=None, sync=SYNC_POSTS):
+    # With sync, jobs that are already posted are re-checked: a changed fingerprint
+    # patches only the post fields that differ, an unchanged one costs no API call,
+    # and live posts past their deadline are expired in batches after publishing.
+    metrics.reset()
     # Handle GitHub Actions environment variables for credentials
     if 'GOOGLE_CREDENTIALS' in os.environ and 'TOKEN_PICKLE' in os.environ:
         with open('credentials.json', 'w') as f:
@@ -323,14 +1387,164 @@ def run_daily_job_posting():
         with open('token.pickle', 'wb') as f:
             f.write(base64.b64decode(os.environ['TOKEN_PICKLE']))
 
-    jobs = fetch_improved_jobs(40)  # Target 40 jobs
-    for job in jobs:
-        publish_job_post(service, BLOG_ID, job)
+    if not dry_run and service is None:
+        started = time.perf_counter()
+        service = authenticate()
+        STARTUP_TIMES['auth'] = time.perf_counter() - started
+        metrics.observe('run.auth', STARTUP_TIMES['auth'])
+        print(f"Startup: import {STARTUP_TIMES['import'] * 1000:.0f} ms, auth {STARTUP_TIMES['auth'] * 1000:.0f} ms")
+        if not service:
+            print("Authentication failed. Re-run authentication cell!")
+            return
+
+    index = JobIndex()
+    limiter = blogger_limiter()
+    queued = set()
+    totals = {'skipped': 0, 'posted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'unconfirmed': 0}
+    results = []  # One record per job sent (or, in a dry run, that would be sent)
+
+    def record(item, status, outcome=None):
+        outcome = outcome or {}
+        results.append({
+            'key': job_key(item['job']),
+            'title': item['job']['title'],
+            'action': item['action'],
+            'status': status,
+            'http_status': outcome.get('http_status'),
+            'attempts': outcome.get('attempts', 0),
+            'post_url': (outcome.get('response') or {}).get('url'),
+            'error': outcome.get('error'),
+        })
+
+    def unpublished(jobs):
+        for job in jobs:
+            key = job_key(job)
+            if key in queued:
+                totals['skipped'] += 1
+                continue
+            queued.add(key)
+            if sync:
+                row = index.lookup(key)
+                if row and row['status'] == 'live' and row['post_id']:
+                    # Keep the original post date so the re-render matches what is live and the
+                    # deadline stays put; rows from before sync only have the time they were posted
+                    yield {**job, 'key': key, 'published': row['job_published'] or row['published_at']}
+                    continue
+                seen = row is not None
+            else:
+                seen = bool(index.seen_keys([key]))
+            if seen:
+                totals['skipped'] += 1
+                continue
+            yield {**job, 'key': key}
+
+    def render(job):
+        row = index.lookup(job['key']) if sync else None
+        if row is None:
+            return {'action': 'insert', 'job': job, 'body': build_post_body(BLOG_ID, job)}
+        fingerprint = job_fingerprint(job)
+        if row['fingerprint'] == fingerprint:
+            totals['unchanged'] += 1
+            return None
+        body = build_post_body(BLOG_ID, job)
+        if row['fingerprint'] is None:
+            # Posted before fingerprints were kept: adopt the current render as the baseline
+            if not dry_run:
+                index.mark_synced(job, body)
+            totals['unchanged'] += 1
+            return None
+        changes = {field: body[field] for field, stored in (('title', row['title_hash']), ('content', row['content_hash']))
+                   if text_hash(body[field]) != stored}
+        if not changes:
+            if not dry_run:
+                index.mark_synced(job, body)
+            totals['unchanged'] += 1
+            return None
+        return {'action': 'patch', 'job': job, 'body': body, 'post_id': row['post_id'], 'changes': changes}
+
+    def publish(batch):
+        if dry_run:
+            for item in batch:
+                verb = f"update ({', '.join(item['changes'])})" if item['action'] == 'patch' else 'post'
+                print(f"Would {verb}: {item['body']['title']} ({item['job']['title']}, {len(item['body']['content'])} chars)")
+                totals['updated' if item['action'] == 'patch' else 'posted'] += 1
+                record(item, 'dry_run')
+            return
+        for item, outcome in zip(batch, apply_post_changes(service, BLOG_ID, batch, limiter=limiter)):
+            record(item, outcome['status'], outcome)
+            if outcome['status'] == 'unconfirmed':
+                # Kept in the index so later runs skip it instead of posting a duplicate
+                index.mark_published(outcome['job'], None, outcome['body'], status='unconfirmed')
+                totals['unconfirmed'] += 1
+            elif outcome['status'] != 'ok':
+                totals['failed'] += 1
+            elif outcome['action'] == 'patch':
+                index.mark_synced(outcome['job'], outcome['body'])
+                totals['updated'] += 1
+            else:
+                index.mark_published(outcome['job'], outcome['response'], outcome['body'])
+                totals['posted'] += 1
+
+    try:
+        # Fetch, render and publish overlap: later pages download while earlier jobs publish
+        jobs = unpublished(iter_improved_jobs(limit))
+        if ENRICH_DETAILS:
+            jobs = iter_enriched_jobs(jobs)
+        with metrics.timer('run.pipeline'):
+            run_pipeline(jobs, [render], publish)
+        if sync and not dry_run:
+            with metrics.timer('run.expire'):
+                totals['expired'] = expire_posts(service, BLOG_ID, index, limiter=limiter)
+    finally:
+        index.close()
+        print(f"{'Rendered (dry run)' if dry_run else 'Published'} {totals['posted']} jobs, {totals['failed']} failed, {totals['skipped']} already published.")
+        if sync:
+            print(f"Sync: {totals['updated']} updated, {totals['unchanged']} unchanged, {totals.get('expired', 0)} expired.")
+        if totals['unconfirmed']:
+            print(f"{totals['unconfirmed']} posts got no answer from Blogger and are marked 'unconfirmed' in the index; "
+                  "check the blog and delete their rows to post them again.")
+        for result in results:
+            detail = result['post_url'] or result['error'] or ''
+            print(f"  {result['status']:<11} {result['action']:<6} {result['title']}{' - ' + detail if detail else ''}")
+        report = metrics.write(RUN_REPORT_PATH, dry_run=dry_run, limit=limit, jobs=totals, outcomes=results)
+        print(f"Run report written to {RUN_REPORT_PATH} ({report['duration_seconds']:.1f}s)")
 
     # Simulate next run (for testing; GitHub Actions handles scheduling)
     next_run = datetime.now() + timedelta(days=1)
     print(f"Next run scheduled for: {next_run.strftime('%Y-%m-%d %H:%M:%S')} EAT")
     print("Note: Automated via GitHub Actions at 8:00 AM EAT.")
+    return report
+
+def render_only(jobs_path=None, out_dir='rendered'):
+    # Renders posts from a JSON list of job dicts (or the sample jobs) without any network access
+    if jobs_path:
+        with open(jobs_path) as f:
+            jobs = json.load(f)
+    else:
+        jobs = sample_jobs()
+    os.makedirs(out_dir, exist_ok=True)
+    for i, job in enumerate(jobs, 1):
+        job.setdefault('published', str(datetime.now()))
+        path = os.path.join(out_dir, f'{i:03d}.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(format_job_post(job))
+        print(f"Rendered {job['title']} -> {path}")
+
+STARTUP_TIMES['import'] = time.perf_counter() - _IMPORT_STARTED
 
 if __name__ == "__main__":
-    run_daily_job_posting()
+    parser = argparse.ArgumentParser(description='Scrape Kenyan job listings and post them to Blogger.')
+    parser.add_argument('--limit', type=int, default=40, help='Number of jobs to fetch (default 40)')
+    parser.add_argument('--dry-run', action='store_true', help='Fetch and render, but do not authenticate or publish')
+    parser.add_argument('--render-only', nargs='?', const='', metavar='JOBS_JSON',
+                        help='Only render posts from a JSON file of jobs (or the sample jobs) into --out')
+    parser.add_argument('--out', default='rendered', help='Output directory for --render-only')
+    parser.add_argument('--profile', metavar='PSTATS_FILE', default=os.environ.get('JOB_PROFILE'),
+                        help='Profile the run with cProfile and write the stats here')
+    parser.add_argument('--sync', action='store_true', default=SYNC_POSTS,
+                        help='Also patch changed posts and expire posts past their deadline')
+    args = parser.parse_args()
+    if args.render_only is not None:
+        render_only(args.render_only or None, args.out)
+    else:
+        run_daily_job_posting(args.limit, dry_run=args.dry_run, profile_path=args.profile, sync=args.sync)
@@ -0,0 +1,49 @@
+# JobIndex lookups against a throwaway SQLite file.
+# Run from the repo root: python -m pytest -q tests
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_automation as ja
+
+def make_job(i):
+    return {
+        'title': f'Finance Officer {i}',
+        'url': f'https://www.myjobmag.co.ke/job/finance-officer-{i}',
+        'description': 'Keep the books balanced for a growing Kenyan firm.',
+        'company': 'Acme Ltd',
+        'location': 'Nairobi, Kenya',
+        'published': str(datetime.now())
+    }
+
+@pytest.fixture
+def index(tmp_path):
+    index = ja.JobIndex(str(tmp_path / 'published_jobs.sqlite'))
+    yield index
+    index.close()
+
+def test_seen_since_returns_jobs_published_on_or_after(index):
+    now = datetime.now()
+    jobs = [make_job(i) for i in range(3)]
+    for job in jobs:
+        index.mark_published(job, {'id': '1', 'url': 'http://blog.example/1.html'})
+    for job, days in zip(jobs, (0, 5, 40)):
+        index.conn.execute('UPDATE published_jobs SET published_at = ? WHERE job_key = ?',
+                           ((now - timedelta(days=days)).isoformat(), ja.job_key(job)))
+
+    assert index.seen_since((now - timedelta(days=7)).date()) == {ja.job_key(jobs[0]), ja.job_key(jobs[1])}
+    assert index.seen_since(now - timedelta(days=1)) == {ja.job_key(jobs[0])}
+    assert index.seen_since(now + timedelta(days=1)) == set()
+
+def test_seen_since_uses_the_published_at_index(index):
+    statements = []
+    index.conn.set_trace_callback(statements.append)
+    index.seen_since(datetime(2026, 1, 1))
+    index.conn.set_trace_callback(None)
+    [query] = [sql for sql in statements if sql.startswith('SELECT')]
+    plan = index.conn.execute('EXPLAIN QUERY PLAN ' + query).fetchall()
+    assert any('published_jobs_published_at' in row[-1] for row in plan)
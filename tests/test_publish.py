@@ -0,0 +1,137 @@
+# Batched publishing: which failures are retried, and what happens to inserts that got no answer.
+# Run from the repo root: python -m pytest -q tests
+import os
+import socket
+import sqlite3
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_automation as ja
+
+JobIndex = ja.JobIndex
+
+class HttpError(Exception):
+    # Shaped like googleapiclient's HttpError: the status lives on .resp
+    def __init__(self, status):
+        super().__init__(f'HTTP {status}')
+        self.resp = type('resp', (), {'status': status})()
+
+class ScriptedBlogger:
+    # Each batch.execute() takes the next entry of `script`: an exception raised for the
+    # whole batch, a {payload: exception} map of per-request errors, or None for success
+    def __init__(self, script=()):
+        self.script = list(script)
+        self.sent = []
+
+    def posts(self):
+        return self
+
+    def insert(self, **kwargs):
+        return 'insert'
+
+    def new_batch_http_request(self, callback):
+        return ScriptedBatch(self, callback)
+
+class ScriptedBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        step = self.service.script.pop(0) if self.service.script else None
+        self.service.sent.append([request for _, request in self.requests])
+        if isinstance(step, Exception):
+            raise step
+        for request_id, request in self.requests:
+            error = (step or {}).get(request)
+            if error:
+                self.callback(request_id, None, error)
+            else:
+                self.callback(request_id, {'id': request_id, 'url': f'http://blog.example/{request_id}.html', 'title': request}, None)
+
+class Unlimited:
+    def acquire(self, tokens=1):
+        pass
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(ja, 'backoff_delay', lambda attempt, base=1.0, cap=60.0: 0)
+
+@pytest.mark.parametrize('exception, idempotent, expected', [
+    (HttpError(429), False, True),
+    (HttpError(503), False, True),
+    (HttpError(400), True, False),
+    (HttpError(404), True, False),
+    (TimeoutError('read timed out'), True, True),
+    (TimeoutError('read timed out'), False, False),
+    (ConnectionRefusedError('refused'), False, True),
+    (socket.gaierror('no such host'), False, True),
+])
+def test_is_retryable(exception, idempotent, expected):
+    assert ja.is_retryable(exception, idempotent) is expected
+
+def run_batched(service, payloads):
+    return ja.execute_batched(service, payloads, lambda payload: payload, limiter=Unlimited(),
+                              idempotent=lambda payload: payload != 'insert')
+
+def test_read_timeout_is_not_retried_for_inserts():
+    service = ScriptedBlogger([TimeoutError('read timed out')])
+    insert, patch = run_batched(service, ['insert', 'patch'])
+    assert (insert['status'], insert['attempts']) == ('unconfirmed', 1)
+    assert (patch['status'], patch['attempts']) == ('ok', 2)
+    assert service.sent == [['insert', 'patch'], ['patch']]
+
+def test_connect_error_is_retried_for_inserts():
+    service = ScriptedBlogger([ConnectionRefusedError('refused')])
+    [insert] = run_batched(service, ['insert'])
+    assert (insert['status'], insert['attempts']) == ('ok', 2)
+
+def test_throttled_insert_is_retried():
+    service = ScriptedBlogger([{'insert': HttpError(429)}])
+    [insert] = run_batched(service, ['insert'])
+    assert (insert['status'], insert['attempts']) == ('ok', 2)
+
+def test_rejected_insert_fails_without_retry():
+    service = ScriptedBlogger([{'insert': HttpError(400)}])
+    [insert] = run_batched(service, ['insert'])
+    assert (insert['status'], insert['http_status'], insert['attempts']) == ('failed', 400, 1)
+
+def test_unconfirmed_inserts_are_indexed_and_skipped_next_run(tmp_path, monkeypatch):
+    path = str(tmp_path / 'published_jobs.sqlite')
+    monkeypatch.setattr(ja, 'JobIndex', lambda: JobIndex(path))
+    monkeypatch.setattr(ja, 'RUN_REPORT_PATH', str(tmp_path / 'run_report.json'))
+    monkeypatch.setattr(ja, 'ENRICH_DETAILS', False)
+    monkeypatch.setattr(ja, 'BLOGGER_REQUESTS_PER_MINUTE', 1_000_000)
+    job = {
+        'title': 'Finance Officer 0',
+        'url': 'https://www.myjobmag.co.ke/job/finance-officer-0',
+        'description': 'Keep the books balanced for a growing Kenyan firm.',
+        'company': 'Acme Ltd',
+        'location': 'Nairobi, Kenya',
+        'published': str(datetime.now())
+    }
+    monkeypatch.setattr(ja, 'SOURCES', {'fake': {'fetch': lambda limit: iter([job]), 'timeout': 5}})
+
+    service = ScriptedBlogger([TimeoutError('read timed out')])
+    report = ja.run_daily_job_posting(1, service=service)
+    assert report['jobs']['unconfirmed'] == 1 and report['jobs']['failed'] == 0
+    [outcome] = report['outcomes']
+    assert (outcome['key'], outcome['action'], outcome['status'], outcome['http_status']) == \
+        (ja.job_key(job), 'insert', 'unconfirmed', None)
+    conn = sqlite3.connect(path)
+    assert conn.execute('SELECT post_id, status FROM published_jobs').fetchall() == [(None, 'unconfirmed')]
+    conn.close()
+
+    for sync in (False, True):
+        service = ScriptedBlogger()
+        report = ja.run_daily_job_posting(1, service=service, sync=sync)
+        assert service.sent == []  # Not posted again, and never expired (no post id)
+        assert report['jobs']['skipped'] == 1 and report['outcomes'] == []
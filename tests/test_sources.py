@@ -0,0 +1,70 @@
+# Fan-out over job-board sources: timeouts, de-duplication and stopping abandoned boards.
+# Run from the repo root: python -m pytest -q tests
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_automation as ja
+
+@pytest.fixture
+def sources(monkeypatch):
+    registry = {}
+    monkeypatch.setattr(ja, 'SOURCES', registry)
+    return registry
+
+def job(title, company, url):
+    return {'title': title, 'company': company, 'url': url}
+
+def test_slow_consumer_keeps_jobs_that_arrived_in_time(sources):
+    sources['fast'] = {'fetch': lambda limit: (job(f'Role {i}', 'Acme', f'http://a/{i}') for i in range(10)), 'timeout': 1}
+    titles = []
+    for found in ja.iter_source_jobs(100, deadline=10):
+        titles.append(found['title'])
+        time.sleep(0.3)  # Publishing backpressure
+    assert titles == [f'Role {i}' for i in range(10)]
+
+def test_same_title_is_merged_across_boards_only(sources):
+    def branches(limit):
+        yield job('Teller', 'Bank', 'http://b/1')
+        yield job('Teller', 'Bank', 'http://b/2')  # Another branch: a different vacancy
+        yield job('Teller', 'Bank', 'http://b/2?ref=list')  # Same vacancy, same canonical URL
+
+    def other(limit):
+        time.sleep(0.1)
+        yield job('teller ', 'BANK', 'http://c/1')  # The first board's vacancy again
+
+    sources['branches'] = {'fetch': branches, 'timeout': 5}
+    sources['other'] = {'fetch': other, 'timeout': 5}
+    assert [found['url'] for found in ja.iter_source_jobs(100, deadline=10)] == ['http://b/1', 'http://b/2']
+
+def test_abandoned_source_stops_crawling(sources):
+    produced = []
+    closed = threading.Event()
+
+    def slow(limit):
+        try:
+            for i in range(100):
+                produced.append(i)
+                yield job(f'Slow {i}', 'X', f'http://s/{i}')
+                time.sleep(0.2)
+        finally:
+            closed.set()
+
+    def steady(limit):
+        for i in range(20):
+            yield job(f'Steady {i}', 'Y', f'http://t/{i}')
+            time.sleep(0.1)
+
+    sources['slow'] = {'fetch': slow, 'timeout': 0.5}
+    sources['steady'] = {'fetch': steady, 'timeout': 5}
+    jobs = ja.iter_source_jobs(100, deadline=10)
+    titles = [next(jobs)['title'] for _ in range(12)]  # Keep reading well past slow's timeout
+    assert closed.wait(1)  # Abandoned while the fan-out was still running
+    assert len(produced) <= 5
+    assert any(title.startswith('Slow') for title in titles)
+    jobs.close()
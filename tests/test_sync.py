@@ -0,0 +1,205 @@
+# Sync mode against an in-memory Blogger stand-in: fingerprints, patches, backfill and expiry.
+# Run from the repo root: python -m pytest -q tests
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_automation as ja
+
+JobIndex = ja.JobIndex
+
+class NotFound(Exception):
+    # Shaped like googleapiclient's HttpError: the status lives on .resp
+    class resp:
+        status = 404
+
+class FakeBlogger:
+    # Records every sub-request; posts in `missing` answer 404
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+        self.next_id = 0
+
+    def posts(self):
+        return self
+
+    def insert(self, **kwargs):
+        return 'insert', kwargs
+
+    def patch(self, **kwargs):
+        return 'patch', kwargs
+
+    def revert(self, **kwargs):
+        return 'revert', kwargs
+
+    def delete(self, **kwargs):
+        return 'delete', kwargs
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def answer(self, method, kwargs):
+        self.calls.append((method, kwargs))
+        if kwargs.get('postId') in self.missing:
+            raise NotFound()
+        if method == 'insert':
+            self.next_id += 1
+            post_id = str(self.next_id)
+            return {'id': post_id, 'url': f'http://blog.example/{post_id}.html', 'title': kwargs['body']['title']}
+        return {'id': kwargs['postId']}
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, (method, kwargs) in self.requests:
+            try:
+                response = self.service.answer(method, kwargs)
+            except NotFound as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+def make_job(i, **changes):
+    job = {
+        'title': f'Finance Officer {i}',
+        'url': f'https://www.myjobmag.co.ke/job/finance-officer-{i}',
+        'description': 'Keep the books balanced for a growing Kenyan firm.',
+        'company': 'Acme Ltd',
+        'location': 'Nairobi, Kenya',
+        'published': str(datetime.now())
+    }
+    job.update(changes)
+    return job
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'published_jobs.sqlite')
+    monkeypatch.setattr(ja, 'JobIndex', lambda: JobIndex(path))
+    monkeypatch.setattr(ja, 'RUN_REPORT_PATH', str(tmp_path / 'run_report.json'))
+    monkeypatch.setattr(ja, 'ENRICH_DETAILS', False)
+    monkeypatch.setattr(ja, 'BLOGGER_REQUESTS_PER_MINUTE', 1_000_000)
+    return path
+
+@pytest.fixture
+def run(index_path, monkeypatch):
+    def run(jobs, service):
+        monkeypatch.setattr(ja, 'SOURCES', {'fake': {'fetch': lambda limit: iter(jobs), 'timeout': 5}})
+        return ja.run_daily_job_posting(len(jobs), service=service, sync=True)
+    return run
+
+def stored(index_path, job):
+    conn = sqlite3.connect(index_path)
+    row = conn.execute('SELECT post_id, fingerprint, status FROM published_jobs WHERE job_key = ?', (ja.job_key(job),)).fetchone()
+    conn.close()
+    return row
+
+def test_unchanged_jobs_make_no_api_calls(run):
+    jobs = [make_job(i) for i in range(3)]
+    service = FakeBlogger()
+    assert run(jobs, service)['jobs']['posted'] == 3
+    assert [method for method, _ in service.calls] == ['insert'] * 3
+
+    service.calls.clear()
+    report = run([make_job(i) for i in range(3)], service)
+    assert service.calls == []
+    assert report['jobs']['unchanged'] == 3 and report['jobs']['posted'] == 0
+    assert 'render.job' not in report['timings']  # A matching fingerprint skips rendering too
+
+def test_changed_job_patches_only_changed_fields(run, index_path):
+    service = FakeBlogger()
+    run([make_job(0), make_job(1)], service)
+    post_id = stored(index_path, make_job(0))[0]
+
+    service.calls.clear()
+    changed = make_job(0, description='Now also leads the audit team.', salary='KSh 90,000')
+    totals = run([changed, make_job(1)], service)['jobs']
+    assert totals['updated'] == 1 and totals['unchanged'] == 1
+    [(method, kwargs)] = service.calls
+    assert method == 'patch'
+    assert kwargs['postId'] == post_id
+    assert set(kwargs['body']) == {'content'}  # The title did not change
+    assert 'Now also leads the audit team.' in kwargs['body']['content']
+    assert stored(index_path, changed)[1] == ja.job_fingerprint(changed)
+
+    service.calls.clear()
+    run([changed, make_job(1)], service)
+    assert service.calls == []
+
+def seed_legacy_row(index_path, job, post_id, published_at):
+    # An index written before sync existed: no fingerprint, hashes, job date or deadline columns
+    conn = sqlite3.connect(index_path)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS published_jobs (job_key TEXT PRIMARY KEY, url TEXT NOT NULL, title TEXT NOT NULL,'
+        ' company TEXT NOT NULL, post_id TEXT, post_url TEXT, published_at TEXT NOT NULL)'
+    )
+    conn.execute('INSERT INTO published_jobs VALUES (?, ?, ?, ?, ?, ?, ?)',
+                 (ja.job_key(job), job['url'], job['title'], job['company'], post_id,
+                  f'http://blog.example/{post_id}.html', published_at.isoformat()))
+    conn.commit()
+    conn.close()
+
+def test_rows_from_before_fingerprints_are_backfilled(run, index_path):
+    job = make_job(0)
+    published_at = datetime.now() - timedelta(days=2)
+    seed_legacy_row(index_path, job, '7', published_at)
+
+    service = FakeBlogger()
+    totals = run([job], service)['jobs']
+    assert service.calls == []  # The current render is adopted as the baseline
+    assert totals['unchanged'] == 1
+    rerendered = {**job, 'published': published_at.isoformat()}  # Dated when it was first posted
+    assert stored(index_path, job) == ('7', ja.job_fingerprint(rerendered), 'live')
+
+    run([make_job(0, description='Updated duties.')], service)
+    assert [(method, kwargs['postId']) for method, kwargs in service.calls] == [('patch', '7')]
+
+def test_legacy_rows_keep_their_deadline_and_expire(run, index_path):
+    job = make_job(0)
+    published_at = datetime.now() - timedelta(days=40)
+    seed_legacy_row(index_path, job, '7', published_at)
+
+    service = FakeBlogger()
+    totals = run([job], service)['jobs']
+    assert service.calls == [('revert', {'blogId': ja.BLOG_ID, 'postId': '7'})]
+    assert totals['expired'] == 1
+    conn = sqlite3.connect(index_path)
+    row = conn.execute('SELECT status, job_published, deadline FROM published_jobs').fetchone()
+    conn.close()
+    assert row == ('expired', published_at.isoformat(), (published_at + timedelta(days=30)).date().isoformat())
+
+def test_expired_posts_are_reverted_and_404_counts_as_done(run, index_path):
+    jobs = [make_job(i, deadline='2020-01-01') for i in range(2)] + [make_job(2)]
+    service = FakeBlogger(missing={'2'})  # The second post was already removed by hand
+    totals = run(jobs, service)['jobs']
+    assert totals['posted'] == 3 and totals['expired'] == 2
+    assert sorted(kwargs['postId'] for method, kwargs in service.calls if method == 'revert') == ['1', '2']
+    assert [stored(index_path, job)[2] for job in jobs] == ['expired', 'expired', 'live']
+
+    service.calls.clear()
+    totals = run(jobs, service)['jobs']
+    assert service.calls == []  # Expired posts are neither re-posted nor expired again
+    assert totals['skipped'] == 2 and totals['expired'] == 0
+
+def test_expire_posts_can_delete(index_path):
+    index = ja.JobIndex()
+    job = make_job(0, deadline='2020-01-01')
+    index.mark_published(job, {'id': '5', 'url': 'http://blog.example/5.html'})
+    service = FakeBlogger()
+    try:
+        assert ja.expire_posts(service, 'blog', index, action='delete') == 1
+        assert service.calls == [('delete', {'blogId': 'blog', 'postId': '5'})]
+        assert index.expired(datetime.now().date()) == []
+    finally:
+        index.close()